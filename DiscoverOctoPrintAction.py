@@ -55,27 +55,78 @@ from .NetworkReplyTimeout import NetworkReplyTimeout
 from .PowerPlugins import PowerPlugins
 from .OctoPrintOutputDevicePlugin import OctoPrintOutputDevicePlugin
 from .OctoPrintOutputDevice import OctoPrintOutputDevice
+from .PluginUtils import (
+    getPluginVersion,
+    jsonFromReply,
+    setFollowRedirects,
+    setHttp2Allowed,
+)
 
 import os.path
 import json
 import base64
+import re
+import functools
+import operator
+import time
 
-from typing import cast, Any, Tuple, Dict, List, Optional, TYPE_CHECKING
+from typing import cast, Any, Callable, Tuple, Dict, List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from UM.Settings.ContainerInterface import ContainerInterface
+    from cura.Settings.GlobalStack import GlobalStack
 
 catalog = i18nCatalog("octoprint")
 
+# Matches the endpoint of the replies handled by DiscoverOctoPrintAction._onRequestFinished
+_endpoint_regex = re.compile(r"/(plugin/appkeys/probe|plugin/appkeys/request|api/settings)")
+
+
+##  Get the User-Agent header value for requests; it does not change during a session
+@functools.lru_cache(maxsize=None)
+def _getUserAgent() -> bytes:
+    application = CuraApplication.getInstance()
+    return (
+        "%s/%s %s/%s"
+        % (
+            application.getApplicationName(),
+            application.getVersion(),
+            "OctoPrintPlugin",
+            getPluginVersion(),
+        )
+    ).encode()
+
 
 class DiscoverOctoPrintAction(MachineAction):
+    _appkey_poll_initial_interval = 500
+    _appkey_poll_max_interval = 3000
+
+    _appkey_probe_cache_lifetime = 30  # seconds
+
+    _shared_network_manager = None  # type: Optional[QNetworkAccessManager]
+
     def __init__(self, parent: QObject = None) -> None:
         super().__init__(
             "DiscoverOctoPrintAction", catalog.i18nc("@action", "Connect OctoPrint")
         )
 
         self._application = CuraApplication.getInstance()
+        # Keep a reference to the active machine instead of asking the application for it on every QML read
+        self._global_container_stack = (
+            self._application.getGlobalContainerStack()
+        )  # type: Optional[GlobalStack]
+        self._application.globalContainerStackChanged.connect(
+            self._onGlobalContainerStackChanged
+        )
         self._network_plugin = None  # type: Optional[OctoPrintOutputDevicePlugin]
+        self._sorted_instances = None  # type: Optional[List[Any]]
+        self._recheck_connections_scheduled = False
+
+        # Discovery tends to report instances in bursts; notify QML once per burst
+        self._instances_changed_timer = QTimer()
+        self._instances_changed_timer.setInterval(50)
+        self._instances_changed_timer.setSingleShot(True)
+        self._instances_changed_timer.timeout.connect(self.instancesChanged.emit)
 
         qml_folder = "qml" if not USE_QT5 else "qml_qt5"
 
@@ -83,44 +134,74 @@ class DiscoverOctoPrintAction(MachineAction):
 
         #  QNetwork manager needs to be created in advance. If we don't it can happen that it doesn't correctly
         #  hook itself into the event loop, which results in events never being fired / done.
-        self._network_manager = QNetworkAccessManager()
+        #  The manager is shared so connections (and their DNS lookups) can be reused if the action is recreated.
+        if DiscoverOctoPrintAction._shared_network_manager is None:
+            DiscoverOctoPrintAction._shared_network_manager = QNetworkAccessManager()
+        self._network_manager = DiscoverOctoPrintAction._shared_network_manager
         self._network_manager.finished.connect(self._onRequestFinished)
 
+        # ignore SSL errors (eg for self-signed certificates)
+        self._ssl_configuration = QSslConfiguration.defaultConfiguration()
+        self._ssl_configuration.setPeerVerifyMode(QSslSocketPeerVerifyModes.VerifyNone)
+
+        # Handlers for finished requests, by operation and endpoint (see _endpoint_regex)
+        self._reply_handlers = {
+            (
+                QNetworkAccessManagerOperations.PostOperation,
+                "plugin/appkeys/request",
+            ): self._onAppKeyRequestPosted,
+            (
+                QNetworkAccessManagerOperations.GetOperation,
+                "plugin/appkeys/probe",
+            ): self._onAppKeyProbeReceived,
+            (
+                QNetworkAccessManagerOperations.GetOperation,
+                "plugin/appkeys/request",
+            ): self._onAppKeyPollReceived,
+            (
+                QNetworkAccessManagerOperations.GetOperation,
+                "api/settings",
+            ): self._onSettingsReceived,
+        }  # type: Dict[Tuple[Any, str], Callable[[QNetworkReply, int], None]]
+
+        # Handlers for the status codes of these endpoints
+        self._appkey_request_status_handlers = {
+            201: self._onAppKeyRequestAccepted,
+            202: self._onAppKeyRequestAccepted,
+            404: self._onAppKeyRequestNotSupported,
+        }  # type: Dict[int, Callable[[QNetworkReply, int], None]]
+        self._appkey_poll_status_handlers = {
+            200: self._onAppKeyGranted,
+            202: self._onAppKeyPending,
+            404: self._onAppKeyDenied,
+        }  # type: Dict[int, Callable[[QNetworkReply, int], None]]
+        self._settings_status_handlers = {
+            200: self._onSettingsAccepted,
+            401: self._onSettingsUnauthorized,
+            502: self._onSettingsUnavailable,
+            503: self._onSettingsUnavailable,
+        }  # type: Dict[int, Callable[[QNetworkReply, int], None]]
+
         self._settings_reply = None  # type: Optional[QNetworkReply]
         self._settings_reply_timeout = None  # type: Optional[NetworkReplyTimeout]
 
         self._instance_supports_appkeys = False
+        # Results of probing for AppKey support, by base url: (time of probe, supported)
+        self._appkey_probe_cache = {}  # type: Dict[str, Tuple[float, bool]]
         self._appkey_reply = None  # type: Optional[QNetworkReply]
         self._appkey_request = None  # type: Optional[QNetworkRequest]
         self._appkey_instance_id = ""
 
+        # The AppKey decision is polled with an increasing interval, because users may take a while to respond
+        self._appkey_poll_interval = self._appkey_poll_initial_interval
         self._appkey_poll_timer = QTimer()
-        self._appkey_poll_timer.setInterval(500)
+        self._appkey_poll_timer.setInterval(self._appkey_poll_interval)
         self._appkey_poll_timer.setSingleShot(True)
         self._appkey_poll_timer.timeout.connect(self._pollApiKey)
 
-        # Try to get version information from plugin.json
-        plugin_file_path = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "plugin.json"
-        )
-        try:
-            with open(plugin_file_path) as plugin_file:
-                plugin_info = json.load(plugin_file)
-                self._plugin_version = plugin_info["version"]
-        except:
-            # The actual version info is not critical to have so we can continue
-            self._plugin_version = "0.0"
-            Logger.logException("w", "Could not get version information for the plugin")
-
-        self._user_agent = (
-            "%s/%s %s/%s"
-            % (
-                self._application.getApplicationName(),
-                self._application.getVersion(),
-                "OctoPrintPlugin",
-                self._plugin_version,
-            )
-        ).encode()
+        self._plugin_version = getPluginVersion()
+
+        self._user_agent = _getUserAgent()
 
         self._settings_instance = None  # type: Optional[OctoPrintOutputDevice]
 
@@ -137,17 +218,20 @@ class DiscoverOctoPrintAction(MachineAction):
         self._preferences = self._application.getPreferences()
         self._preferences.addPreference("octoprint/keys_cache", "")
 
+        keys_cache = self._preferences.getValue("octoprint/keys_cache")
         try:
-            self._keys_cache = json.loads(
-                self._deobfuscateString(
-                    self._preferences.getValue("octoprint/keys_cache")
-                )
+            # There is nothing to decode until the first API key has been stored
+            self._keys_cache = (
+                json.loads(self._deobfuscateString(keys_cache)) if keys_cache else {}
             )
         except ValueError:
             self._keys_cache = {}  # type: Dict[str, Any]
         if not isinstance(self._keys_cache, dict):
             self._keys_cache = {}  # type: Dict[str, Any]
 
+        # Deobfuscated API keys stored in the machine instances, by (stack id, instance id)
+        self._decoded_api_key_cache = {}  # type: Dict[Tuple[str, str], str]
+
         self._additional_components = None  # type:Optional[QObject]
 
         ContainerRegistry.getInstance().containerAdded.connect(self._onContainerAdded)
@@ -155,6 +239,17 @@ class DiscoverOctoPrintAction(MachineAction):
             self._createAdditionalComponentsView
         )
 
+    def _onGlobalContainerStackChanged(self) -> None:
+        self._global_container_stack = self._application.getGlobalContainerStack()
+        self.instanceIdChanged.emit()
+
+    ##  Ensure replies on the shared network manager are no longer handled when the object is destroyed
+    def __del__(self) -> None:
+        try:
+            self._network_manager.finished.disconnect(self._onRequestFinished)
+        except (AttributeError, TypeError, RuntimeError):
+            pass  # Not connected, or the wrapped c++ object is already deleted
+
     @pyqtProperty(str, constant=True)
     def pluginVersion(self) -> str:
         return self._plugin_version
@@ -181,7 +276,8 @@ class DiscoverOctoPrintAction(MachineAction):
             self._network_plugin.startDiscovery()
 
     def _onInstanceDiscovery(self, *args) -> None:
-        self.instancesChanged.emit()
+        self._sorted_instances = None
+        self._instances_changed_timer.start()
 
     @pyqtSlot(str)
     def removeManualInstance(self, name: str) -> None:
@@ -213,12 +309,14 @@ class DiscoverOctoPrintAction(MachineAction):
 
     def _onContainerAdded(self, container: "ContainerInterface") -> None:
         # Add this action as a supported action to all machine definitions
-        if (
-            isinstance(container, DefinitionContainer)
-            and container.getMetaDataEntry("type") == "machine"
-            and container.getMetaDataEntry("supports_usb_connection")
-        ):
+        # This is called for every container that is loaded, so bail out as early as possible
+        if not isinstance(container, DefinitionContainer):
+            return
 
+        metadata = container.getMetaData()
+        if metadata.get("type") == "machine" and metadata.get(
+            "supports_usb_connection"
+        ):
             self._application.getMachineActionManager().addSupportedAction(
                 container.getId(), self.getKey()
             )
@@ -231,27 +329,31 @@ class DiscoverOctoPrintAction(MachineAction):
     @pyqtProperty("QVariantList", notify=instancesChanged)
     def discoveredInstances(self) -> List[Any]:
         if self._network_plugin:
-            instances = list(self._network_plugin.getInstances().values())
-            instances.sort(key=lambda k: k.name)
-            return instances
+            if self._sorted_instances is None:
+                # The sorted list is rebuilt only after the list of instances changed
+                self._sorted_instances = list(
+                    self._network_plugin.getInstances().values()
+                )
+                self._sorted_instances.sort(key=operator.attrgetter("name"))
+            return self._sorted_instances
         else:
             return []
 
     @pyqtSlot(str)
     def setInstanceId(self, key: str) -> None:
-        global_container_stack = self._application.getGlobalContainerStack()
+        global_container_stack = self._global_container_stack
         if global_container_stack:
             global_container_stack.setMetaDataEntry("octoprint_id", key)
+        self._decoded_api_key_cache = {}  # type: Dict[Tuple[str, str], str]
 
-        if self._network_plugin:
-            # Ensure that the connection states are refreshed.
-            self._network_plugin.reCheckConnections()
+        # Ensure that the connection states are refreshed.
+        self._scheduleReCheckConnections()
 
         self.instanceIdChanged.emit()
 
     @pyqtProperty(str, notify=instanceIdChanged)
     def instanceId(self) -> str:
-        global_container_stack = self._application.getGlobalContainerStack()
+        global_container_stack = self._global_container_stack
         if not global_container_stack:
             return ""
 
@@ -270,6 +372,7 @@ class DiscoverOctoPrintAction(MachineAction):
 
         ## Request appkey
         self._appkey_instance_id = instance_id
+        self._resetAppKeyPollInterval()
         self._appkey_request = self._createRequest(
             QUrl(base_url + "plugin/appkeys/request"),
             basic_auth_username,
@@ -291,6 +394,11 @@ class DiscoverOctoPrintAction(MachineAction):
         self._appkey_request = None  # type: Optional[QNetworkRequest]
 
         self._appkey_poll_timer.stop()
+        self._resetAppKeyPollInterval()
+
+    def _resetAppKeyPollInterval(self) -> None:
+        self._appkey_poll_interval = self._appkey_poll_initial_interval
+        self._appkey_poll_timer.setInterval(self._appkey_poll_interval)
 
     def _pollApiKey(self) -> None:
         if not self._appkey_request:
@@ -310,8 +418,16 @@ class DiscoverOctoPrintAction(MachineAction):
 
         instance.getAdditionalData()
 
-        self._instance_supports_appkeys = False
-        self.appKeysSupportedChanged.emit()
+        cached_probe = self._appkey_probe_cache.get(base_url, None)
+        if (
+            cached_probe
+            and time.monotonic() - cached_probe[0] < self._appkey_probe_cache_lifetime
+        ):
+            # This instance was probed moments ago; don't bother it again
+            self._setInstanceSupportsAppKeys(cached_probe[1])
+            return
+
+        self._setInstanceSupportsAppKeys(False)
 
         appkey_probe_request = self._createRequest(
             QUrl(base_url + "plugin/appkeys/probe"),
@@ -331,12 +447,20 @@ class DiscoverOctoPrintAction(MachineAction):
         if not base_url:
             return
 
-        self._instance_responded = False
-        self._instance_api_key_accepted = False
-        self._instance_supports_sd = False
-        self._instance_supports_camera = False
-        self._instance_installed_plugins = []  # type: List[str]
-        self.selectedInstanceSettingsChanged.emit()
+        if (
+            self._instance_responded
+            or self._instance_api_key_accepted
+            or self._instance_supports_sd
+            or self._instance_supports_camera
+            or self._instance_installed_plugins
+        ):
+            # Only notify QML if there is actually some state to reset
+            self._instance_responded = False
+            self._instance_api_key_accepted = False
+            self._instance_supports_sd = False
+            self._instance_supports_camera = False
+            self._instance_installed_plugins = []  # type: List[str]
+            self.selectedInstanceSettingsChanged.emit()
 
         if self._settings_reply:
             if self._settings_reply.isRunning():
@@ -368,37 +492,63 @@ class DiscoverOctoPrintAction(MachineAction):
 
     @pyqtSlot(str)
     def setApiKey(self, api_key: str) -> None:
-        global_container_stack = self._application.getGlobalContainerStack()
+        global_container_stack = self._global_container_stack
         if not global_container_stack:
             return
 
-        global_container_stack.setMetaDataEntry(
-            "octoprint_api_key",
-            base64.b64encode(api_key.encode("ascii")).decode("ascii"),
-        )
+        obfuscated_api_key = self._obfuscateString(api_key)
+        if global_container_stack.getMetaDataEntry("octoprint_api_key", None) != obfuscated_api_key:
+            # Writing the same value would still mark the stack dirty and notify listeners
+            global_container_stack.setMetaDataEntry("octoprint_api_key", obfuscated_api_key)
+            self._decoded_api_key_cache = {}  # type: Dict[Tuple[str, str], str]
 
-        self._keys_cache[self.instanceId] = api_key
-        keys_cache = base64.b64encode(
-            json.dumps(self._keys_cache).encode("ascii")
-        ).decode("ascii")
-        self._preferences.setValue("octoprint/keys_cache", keys_cache)
+        instance_id = self.instanceId
+        if self._keys_cache.get(instance_id) != api_key:
+            self._keys_cache[instance_id] = api_key
+            self._saveKeysCache()
+
+        # Ensure that the connection states are refreshed.
+        self._scheduleReCheckConnections()
 
+    ##  Refresh the connection states after control returns to the event loop, so the QML slots return
+    #   immediately and changing both the instance id and the API key results in a single refresh
+    def _scheduleReCheckConnections(self) -> None:
+        if not self._network_plugin or self._recheck_connections_scheduled:
+            return
+        self._recheck_connections_scheduled = True
+        self._application.callLater(self._reCheckConnections)
+
+    def _reCheckConnections(self) -> None:
+        self._recheck_connections_scheduled = False
         if self._network_plugin:
-            # Ensure that the connection states are refreshed.
             self._network_plugin.reCheckConnections()
 
+    def _saveKeysCache(self) -> None:
+        # compact separators keep the stored preference small
+        keys_cache = self._obfuscateString(
+            json.dumps(self._keys_cache, separators=(",", ":"))
+        )
+        self._preferences.setValue("octoprint/keys_cache", keys_cache)
+
     ##  Get the stored API key of an instance, or the one stored in the machine instance
     #   \return key String containing the key of the machine.
     @pyqtSlot(str, result=str)
     def getApiKey(self, instance_id: str) -> str:
-        global_container_stack = self._application.getGlobalContainerStack()
+        global_container_stack = self._global_container_stack
         if not global_container_stack:
             return ""
 
+        # The memo only holds the key of the instance the machine is connected to
+        cache_key = (global_container_stack.getId(), instance_id)
+        api_key = self._decoded_api_key_cache.get(cache_key, None)
+        if api_key is not None:
+            return api_key
+
         if instance_id == self.instanceId:
             api_key = self._deobfuscateString(
                 global_container_stack.getMetaDataEntry("octoprint_api_key", "")
             )
+            self._decoded_api_key_cache[cache_key] = api_key
         else:
             api_key = self._keys_cache.get(instance_id, "")
 
@@ -442,24 +592,37 @@ class DiscoverOctoPrintAction(MachineAction):
     def instanceSupportsAppKeys(self) -> bool:
         return self._instance_supports_appkeys
 
+    def _setInstanceSupportsAppKeys(self, supports_appkeys: bool) -> None:
+        if supports_appkeys != self._instance_supports_appkeys:
+            self._instance_supports_appkeys = supports_appkeys
+            self.appKeysSupportedChanged.emit()
+
     @pyqtSlot(str, str, str)
     def setContainerMetaDataEntry(
         self, container_id: str, key: str, value: str
     ) -> None:
-        containers = ContainerRegistry.getInstance().findContainers(id=container_id)
-        if not containers:
-            Logger.log(
-                "w",
-                "Could not set metadata of container %s because it was not found.",
-                container_id,
-            )
-            return
+        # QML sets metadata on the active machine, which is already at hand
+        global_container_stack = self._global_container_stack
+        if global_container_stack and global_container_stack.getId() == container_id:
+            container = global_container_stack  # type: ContainerInterface
+        else:
+            containers = ContainerRegistry.getInstance().findContainers(id=container_id)
+            if not containers:
+                Logger.log(
+                    "w",
+                    "Could not set metadata of container %s because it was not found.",
+                    container_id,
+                )
+                return
+            container = containers[0]
 
-        containers[0].setMetaDataEntry(key, value)
+        container.setMetaDataEntry(key, value)
+        if key == "octoprint_api_key" or key == "octoprint_id":
+            self._decoded_api_key_cache = {}  # type: Dict[Tuple[str, str], str]
 
     @pyqtSlot(bool)
     def applyGcodeFlavorFix(self, apply_fix: bool) -> None:
-        global_container_stack = self._application.getGlobalContainerStack()
+        global_container_stack = self._global_container_stack
         if not global_container_stack:
             return
 
@@ -564,13 +727,12 @@ class DiscoverOctoPrintAction(MachineAction):
 
     def _onRequestFailed(self, reply: QNetworkReply) -> None:
         if reply.operation() == QNetworkAccessManagerOperations.GetOperation:
-            if (
-                "api/settings" in reply.url().toString()
-            ):  # OctoPrint settings dump from /settings:
+            url = reply.url().toString()
+            if "api/settings" in url:  # OctoPrint settings dump from /settings:
                 Logger.log(
                     "w",
                     "Connection refused or timeout when trying to access OctoPrint at %s"
-                    % reply.url().toString(),
+                    % url,
                 )
                 self._instance_in_error = True
                 self.selectedInstanceSettingsChanged.emit()
@@ -584,191 +746,198 @@ class DiscoverOctoPrintAction(MachineAction):
             self._onRequestFailed(reply)
             return
 
-        json_data = None
+        match = _endpoint_regex.search(reply.url().toString())
+        if not match:
+            return
 
-        if reply.operation() == QNetworkAccessManagerOperations.PostOperation:
-            if (
-                "/plugin/appkeys/request" in reply.url().toString()
-            ):  # Initial AppKey request
-                if http_status_code == 201 or http_status_code == 202:
-                    try:
-                        json_data = json.loads(bytes(reply.readAll()).decode("utf-8"))
-                    except json.decoder.JSONDecodeError:
-                        Logger.log(
-                            "w", "Received invalid JSON from octoprint instance."
-                        )
-
-                    base_url = reply.url().toString()
-                    base_url = base_url[:base_url.find("/plugin/appkeys/request")]
-
-                    if json_data:
-                        app_token = json_data["app_token"]  # unused; app_token is included in location header
-                        auth_dialog_url = json_data["auth_dialog"] if "auth_dialog" in json_data else base_url
-                    else:
-                        (
-                            instance,
-                            base_url,
-                            basic_auth_username,
-                            basic_auth_password,
-                        ) = self._getInstanceInfo(self._appkey_instance_id)
-
-                        auth_dialog_url = base_url
-
-                    if auth_dialog_url:
-                        self.openWebPage(auth_dialog_url)
-
-                    Logger.log("w", "Start polling for AppKeys decision")
-                    if not self._appkey_request:
-                        return
-                    self._appkey_request.setUrl(
-                        reply.header(QNetworkRequestKnownHeaders.LocationHeader)
-                    )
-                    self._appkey_request.setRawHeader(b"Content-Type", b"")
-                    self._appkey_poll_timer.start()
-                elif http_status_code == 404:
-                    Logger.log(
-                        "w", "This instance of OctoPrint does not support AppKeys"
-                    )
-                    self._appkey_request = None  # type: Optional[QNetworkRequest]
-                else:
-                    response = bytes(reply.readAll()).decode()
-                    Logger.log(
-                        "w",
-                        "Unknown response when requesting an AppKey: %d. OctoPrint said %s"
-                        % (http_status_code, response),
-                    )
-                    self._appkey_request = None  # type: Optional[QNetworkRequest]
+        handler = self._reply_handlers.get((reply.operation(), match.group(1)), None)
+        if handler:
+            handler(reply, http_status_code)
 
-        if reply.operation() == QNetworkAccessManagerOperations.GetOperation:
-            if (
-                "/plugin/appkeys/probe" in reply.url().toString()
-            ):  # Probe for AppKey support
-                if http_status_code == 204:
-                    self._instance_supports_appkeys = True
-                else:
-                    self._instance_supports_appkeys = False
-                self.appKeysSupportedChanged.emit()
+    ##  Handler for the initial AppKey request
+    def _onAppKeyRequestPosted(self, reply: QNetworkReply, http_status_code: int) -> None:
+        handler = self._appkey_request_status_handlers.get(
+            http_status_code, self._onAppKeyRequestUnknownResponse
+        )
+        handler(reply, http_status_code)
 
-            if (
-                "/plugin/appkeys/request" in reply.url().toString()
-            ):  # Periodic AppKey request poll
-                if http_status_code == 202:
-                    self._appkey_poll_timer.start()
-                elif http_status_code == 200:
-                    Logger.log("d", "AppKey granted")
-                    try:
-                        json_data = json.loads(bytes(reply.readAll()).decode("utf-8"))
-                    except json.decoder.JSONDecodeError:
-                        Logger.log(
-                            "w", "Received invalid JSON from octoprint instance."
-                        )
-
-                    if json_data:
-                        api_key = json_data["api_key"]
-                        self._keys_cache[
-                            self._appkey_instance_id
-                        ] = api_key  # store api key in key cache
-
-                        self.appKeyReceived.emit()
-                elif http_status_code == 404:
-                    Logger.log("d", "AppKey denied")
-                else:
-                    response = bytes(reply.readAll()).decode()
-                    Logger.log(
-                        "w",
-                        "Unknown response when waiting for an AppKey: %d. OctoPrint said %s"
-                        % (http_status_code, response),
-                    )
-
-                if http_status_code != 202:
-                    self._appkey_request = None  # type: Optional[QNetworkRequest]
+    def _onAppKeyRequestAccepted(self, reply: QNetworkReply, http_status_code: int) -> None:
+        json_data = jsonFromReply(reply)
 
-            if (
-                "api/settings" in reply.url().toString()
-            ):  # OctoPrint settings dump from /settings:
-                self._instance_in_error = False
-
-                if http_status_code == 200:
-                    Logger.log("d", "API key accepted by OctoPrint.")
-                    self._instance_api_key_accepted = True
-
-                    try:
-                        json_data = json.loads(bytes(reply.readAll()).decode("utf-8"))
-                    except json.decoder.JSONDecodeError:
-                        Logger.log(
-                            "w", "Received invalid JSON from octoprint instance."
-                        )
-                        json_data = {}
-
-                    if "feature" in json_data and "sdSupport" in json_data["feature"]:
-                        self._instance_supports_sd = json_data["feature"]["sdSupport"]
-
-                    if "webcam" in json_data and "streamUrl" in json_data["webcam"]:
-                        stream_url = json_data["webcam"]["streamUrl"]
-                        if stream_url:  # not empty string or None
-                            self._instance_supports_camera = True
-
-                    if "plugins" in json_data:
-                        self._power_plugins_manager.parsePluginData(
-                            json_data["plugins"]
-                        )
-                        self._instance_installed_plugins = list(
-                            json_data["plugins"].keys()
-                        )
-
-                    if self._settings_instance:
-                        api_key = bytes(reply.request().rawHeader(b"X-Api-Key")).decode(
-                            "utf-8"
-                        )
-
-                        self._settings_instance.setApiKey(
-                            api_key
-                        )  # store api key in key cache
-                        if self._settings_instance.getId() == self.instanceId:
-                            self.setApiKey(api_key)
-
-                        self._settings_instance.resetOctoPrintUserName()
-                        self._settings_instance.getAdditionalData()
-                        self._settings_instance.parseSettingsData(json_data)
-
-                    self._settings_instance = None
-
-                elif http_status_code == 401:
-                    Logger.log("d", "Invalid API key for OctoPrint.")
-                    self._instance_api_key_accepted = False
-
-                elif http_status_code == 502 or http_status_code == 503:
-                    Logger.log("d", "OctoPrint is not running.")
-                    self._instance_api_key_accepted = False
-                    self._instance_in_error = True
-
-                self._instance_responded = True
-                self.selectedInstanceSettingsChanged.emit()
+        base_url = reply.url().toString().partition("/plugin/appkeys/request")[0]
+
+        if json_data:
+            app_token = json_data["app_token"]  # unused; app_token is included in location header
+            auth_dialog_url = json_data["auth_dialog"] if "auth_dialog" in json_data else base_url
+        else:
+            (
+                instance,
+                base_url,
+                basic_auth_username,
+                basic_auth_password,
+            ) = self._getInstanceInfo(self._appkey_instance_id)
+
+            auth_dialog_url = base_url
+
+        if auth_dialog_url:
+            self.openWebPage(auth_dialog_url)
+
+        Logger.log("w", "Start polling for AppKeys decision")
+        if not self._appkey_request:
+            return
+        self._appkey_request.setUrl(
+            reply.header(QNetworkRequestKnownHeaders.LocationHeader)
+        )
+        self._appkey_request.setRawHeader(b"Content-Type", b"")
+        self._appkey_poll_timer.start()
+
+    def _onAppKeyRequestNotSupported(self, reply: QNetworkReply, http_status_code: int) -> None:
+        Logger.log("w", "This instance of OctoPrint does not support AppKeys")
+        self._appkey_request = None  # type: Optional[QNetworkRequest]
+
+    def _onAppKeyRequestUnknownResponse(self, reply: QNetworkReply, http_status_code: int) -> None:
+        response = self._previewReplyBody(reply)
+        Logger.log(
+            "w",
+            "Unknown response when requesting an AppKey: %d. OctoPrint said %s"
+            % (http_status_code, response),
+        )
+        self._appkey_request = None  # type: Optional[QNetworkRequest]
+
+    ##  Handler for the probe for AppKey support
+    def _onAppKeyProbeReceived(self, reply: QNetworkReply, http_status_code: int) -> None:
+        self._setInstanceSupportsAppKeys(http_status_code == 204)
+
+        base_url = reply.url().toString().partition("plugin/appkeys/probe")[0]
+        self._appkey_probe_cache[base_url] = (
+            time.monotonic(),
+            self._instance_supports_appkeys,
+        )
+
+    ##  Handler for the periodic AppKey request poll
+    def _onAppKeyPollReceived(self, reply: QNetworkReply, http_status_code: int) -> None:
+        handler = self._appkey_poll_status_handlers.get(
+            http_status_code, self._onAppKeyPollUnknownResponse
+        )
+        handler(reply, http_status_code)
+
+        if http_status_code != 202:
+            self._appkey_request = None  # type: Optional[QNetworkRequest]
+
+    def _onAppKeyPending(self, reply: QNetworkReply, http_status_code: int) -> None:
+        # Still waiting for a decision; back off a little before polling again
+        self._appkey_poll_interval = min(
+            self._appkey_poll_max_interval, int(self._appkey_poll_interval * 1.5)
+        )
+        self._appkey_poll_timer.setInterval(self._appkey_poll_interval)
+        self._appkey_poll_timer.start()
+
+    def _onAppKeyGranted(self, reply: QNetworkReply, http_status_code: int) -> None:
+        Logger.log("d", "AppKey granted")
+        json_data = jsonFromReply(reply)
+
+        if json_data:
+            api_key = json_data["api_key"]
+            self._keys_cache[
+                self._appkey_instance_id
+            ] = api_key  # store api key in key cache
+            # setApiKey only stores the cache if the key changed, which it no longer does after this
+            self._saveKeysCache()
+
+            self.appKeyReceived.emit()
+
+    def _onAppKeyDenied(self, reply: QNetworkReply, http_status_code: int) -> None:
+        Logger.log("d", "AppKey denied")
+
+    def _onAppKeyPollUnknownResponse(self, reply: QNetworkReply, http_status_code: int) -> None:
+        response = self._previewReplyBody(reply)
+        Logger.log(
+            "w",
+            "Unknown response when waiting for an AppKey: %d. OctoPrint said %s"
+            % (http_status_code, response),
+        )
+
+    ##  Handler for the OctoPrint settings dump from /settings
+    def _onSettingsReceived(self, reply: QNetworkReply, http_status_code: int) -> None:
+        self._instance_in_error = False
+
+        handler = self._settings_status_handlers.get(http_status_code, None)
+        if handler:
+            handler(reply, http_status_code)
+
+        self._instance_responded = True
+        self.selectedInstanceSettingsChanged.emit()
+
+    def _onSettingsAccepted(self, reply: QNetworkReply, http_status_code: int) -> None:
+        Logger.log("d", "API key accepted by OctoPrint.")
+        self._instance_api_key_accepted = True
+
+        json_data = jsonFromReply(reply)
+
+        self._instance_supports_sd = json_data.get("feature", {}).get(
+            "sdSupport", False
+        )
+
+        stream_url = json_data.get("webcam", {}).get("streamUrl", "")
+        if stream_url:  # not empty string or None
+            self._instance_supports_camera = True
+
+        plugin_data = json_data.get("plugins", None)
+        if plugin_data is not None:
+            self._power_plugins_manager.parsePluginData(plugin_data)
+            self._instance_installed_plugins = list(plugin_data.keys())
+
+        if self._settings_instance:
+            api_key = bytes(reply.request().rawHeader(b"X-Api-Key")).decode("utf-8")
+
+            self._settings_instance.setApiKey(api_key)  # store api key in key cache
+            if self._settings_instance.getId() == self.instanceId:
+                self.setApiKey(api_key)
+
+            self._settings_instance.resetOctoPrintUserName()
+            self._settings_instance.getAdditionalData()
+            self._settings_instance.parseSettingsData(json_data)
+
+        self._settings_instance = None
+
+    def _onSettingsUnauthorized(self, reply: QNetworkReply, http_status_code: int) -> None:
+        Logger.log("d", "Invalid API key for OctoPrint.")
+        self._instance_api_key_accepted = False
+
+    def _onSettingsUnavailable(self, reply: QNetworkReply, http_status_code: int) -> None:
+        Logger.log("d", "OctoPrint is not running.")
+        self._instance_api_key_accepted = False
+        self._instance_in_error = True
+
+    ##  Get the start of the body of a reply, for logging
+    #   Only the first part is read, because error pages can be quite large
+    def _previewReplyBody(self, reply: QNetworkReply, length: int = 256) -> str:
+        return bytes(reply.read(length) or b"").decode("utf-8", errors="replace")
 
     def _createRequest(
         self, url: str, basic_auth_username: str = "", basic_auth_password: str = ""
     ) -> QNetworkRequest:
         request = QNetworkRequest(url)
-        try:
-            request.setAttribute(QNetworkRequest.FollowRedirectsAttribute, True)
-        except AttributeError:
-            # in Qt6, this is no longer possible (or required), see https://doc.qt.io/qt-6/network-changes-qt6.html#redirect-policies
-            pass
+        setFollowRedirects(request)
+        setHttp2Allowed(request)
         request.setRawHeader(b"User-Agent", self._user_agent)
 
         if basic_auth_username and basic_auth_password:
             data = base64.b64encode(
                 ("%s:%s" % (basic_auth_username, basic_auth_password)).encode()
-            ).decode("utf-8")
-            request.setRawHeader(b"Authorization", ("Basic %s" % data).encode())
+            )
+            request.setRawHeader(b"Authorization", b"Basic " + data)
 
-        # ignore SSL errors (eg for self-signed certificates)
-        ssl_configuration = QSslConfiguration.defaultConfiguration()
-        ssl_configuration.setPeerVerifyMode(QSslSocketPeerVerifyModes.VerifyNone)
-        request.setSslConfiguration(ssl_configuration)
+        request.setSslConfiguration(self._ssl_configuration)
 
         return request
 
+    ##  Utility handler to base64-encode a string (eg an API key)
+    #   Base64 is kept (rather than eg hex) so values stored by older versions of the plugin and values stored by
+    #   this version can be read by either
+    def _obfuscateString(self, source: str) -> str:
+        return base64.b64encode(source.encode("ascii")).decode("ascii")
+
     ##  Utility handler to base64-decode a string (eg an obfuscated API key), if it has been encoded before
     def _deobfuscateString(self, source: str) -> str:
         try:
@@ -6,7 +6,7 @@ try:
 except ImportError: # Cura <= 3.6
     CuraSDKVersion = "6.0.0"
 if CuraSDKVersion >= "8.0.0":
-    from PyQt6.QtCore import QUrl, pyqtProperty, pyqtSignal, pyqtSlot, QRect, QByteArray
+    from PyQt6.QtCore import QUrl, pyqtProperty, pyqtSignal, pyqtSlot, QRect, QTimer
     from PyQt6.QtGui import QImage, QPainter
     from PyQt6.QtQuick import QQuickPaintedItem
     from PyQt6.QtNetwork import (
@@ -19,7 +19,7 @@ if CuraSDKVersion >= "8.0.0":
     QNetworkRequestAttributes = QNetworkRequest.Attribute
     QSslSocketPeerVerifyModes = QSslSocket.PeerVerifyMode
 else:
-    from PyQt5.QtCore import QUrl, pyqtProperty, pyqtSignal, pyqtSlot, QRect, QByteArray
+    from PyQt5.QtCore import QUrl, pyqtProperty, pyqtSignal, pyqtSlot, QRect, QTimer
     from PyQt5.QtGui import QImage, QPainter
     from PyQt5.QtQuick import QQuickPaintedItem
     from PyQt5.QtNetwork import (
@@ -36,6 +36,11 @@ from UM.Logger import Logger
 
 import base64
 
+# NetworkMJPGImage is licensed separately from the rest of the plugin and does not depend on it, so it does not use
+# PluginUtils.setFollowRedirects.
+# in Qt6, following redirects is no longer possible (or required), see https://doc.qt.io/qt-6/network-changes-qt6.html#redirect-policies
+_follow_redirects_attribute = getattr(QNetworkRequestAttributes, "FollowRedirectsAttribute", None)
+
 #
 # A QQuickPaintedItem that progressively downloads a network mjpeg stream,
 # picks it apart in individual jpeg frames, and paints it.
@@ -44,17 +49,25 @@ class NetworkMJPGImage(QQuickPaintedItem):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
-        self._stream_buffer = QByteArray()
+        self._stream_buffer = bytearray()
         self._stream_buffer_start_index = -1
+        self._stream_buffer_scan_index = 0
         self._network_manager = None  # type: QNetworkAccessManager
         self._image_request = None  # type: QNetworkRequest
         self._image_reply = None  # type: QNetworkReply
         self._image = QImage()
         self._image_rect = QRect()
+        self._display_image = self._image  # the image as it is painted, mirrored if needed
 
         self._source_url = QUrl()
         self._started = False
 
+        # Received data is processed at most at display rate, instead of for every chunk that arrives
+        self._stream_data_timer = QTimer()
+        self._stream_data_timer.setInterval(16)
+        self._stream_data_timer.setSingleShot(True)
+        self._stream_data_timer.timeout.connect(self._processStreamData)
+
         self._mirror = False
 
         self.setAntialiasing(True)
@@ -64,11 +77,10 @@ class NetworkMJPGImage(QQuickPaintedItem):
         self.stop()
 
     def paint(self, painter: "QPainter") -> None:
-        if self._mirror:
-            painter.drawImage(self.contentsBoundingRect(), self._image.mirrored())
-            return
+        painter.drawImage(self.contentsBoundingRect(), self._display_image)
 
-        painter.drawImage(self.contentsBoundingRect(), self._image)
+    def _updateDisplayImage(self) -> None:
+        self._display_image = self._image.mirrored() if self._mirror else self._image
 
     def setSourceURL(self, source_url: "QUrl") -> None:
         self._source_url = source_url
@@ -88,6 +100,7 @@ class NetworkMJPGImage(QQuickPaintedItem):
         if mirror == self._mirror:
             return
         self._mirror = mirror
+        self._updateDisplayImage()
         self.mirrorChanged.emit()
         self.update()
 
@@ -115,26 +128,19 @@ class NetworkMJPGImage(QQuickPaintedItem):
             Logger.log("w", "Unable to start camera stream without target!")
             return
 
-        auth_data = ""
+        auth_data = b""
         if self._source_url.userInfo():
             # move auth data to basic authorization header
-            auth_data = base64.b64encode(self._source_url.userInfo().encode()).decode(
-                "utf-8"
-            )
+            auth_data = base64.b64encode(self._source_url.userInfo().encode())
             authority = self._source_url.authority()
             self._source_url.setAuthority(authority.rsplit("@", 1)[1])
 
         self._image_request = QNetworkRequest(self._source_url)
-        try:
-            self._image_request.setAttribute(QNetworkRequestAttributes.FollowRedirectsAttribute, True)
-        except AttributeError:
-            # in Qt6, this is no longer possible (or required), see https://doc.qt.io/qt-6/network-changes-qt6.html#redirect-policies
-            pass
+        if _follow_redirects_attribute is not None:
+            self._image_request.setAttribute(_follow_redirects_attribute, True)
 
         if auth_data:
-            self._image_request.setRawHeader(
-                b"Authorization", ("basic %s" % auth_data).encode()
-            )
+            self._image_request.setRawHeader(b"Authorization", b"basic " + auth_data)
 
         if self._source_url.scheme().lower() == "https":
             # ignore SSL errors (eg for self-signed certificates)
@@ -152,8 +158,10 @@ class NetworkMJPGImage(QQuickPaintedItem):
 
     @pyqtSlot()
     def stop(self) -> None:
-        self._stream_buffer = QByteArray()
+        self._stream_data_timer.stop()
+        self._stream_buffer = bytearray()
         self._stream_buffer_start_index = -1
+        self._stream_buffer_scan_index = 0
 
         if self._image_reply:
             try:
@@ -172,16 +180,22 @@ class NetworkMJPGImage(QQuickPaintedItem):
             self._image_reply = None
             self._image_request = None
 
-        self._network_manager = None
+        # The network manager is kept, so restarting the stream can reuse its connection and settings
 
         self._started = False
 
     def _onStreamDownloadProgress(self, bytes_received: int, bytes_total: int) -> None:
+        # The data stays buffered in the reply until it is processed
+        if not self._stream_data_timer.isActive():
+            self._stream_data_timer.start()
+
+    def _processStreamData(self) -> None:
         # An MJPG stream is (for our purpose) a stream of concatenated JPG images.
         # JPG images start with the marker 0xFFD8, and end with 0xFFD9
         if self._image_reply is None:
             return
-        self._stream_buffer += self._image_reply.readAll()
+        # Extending a bytearray does not copy the data that was already buffered
+        self._stream_buffer.extend(self._image_reply.readAll().data())
 
         if (
             len(self._stream_buffer) > 5000000
@@ -193,19 +207,34 @@ class NetworkMJPGImage(QQuickPaintedItem):
             self.start()
             return
 
+        # Only the data received since the previous tick needs to be searched for markers; step back
+        # one byte in case a marker was split between two chunks
+        scan_index = max(self._stream_buffer_scan_index - 1, 0)
+        self._stream_buffer_scan_index = len(self._stream_buffer)
+
         if self._stream_buffer_start_index == -1:
-            self._stream_buffer_start_index = self._stream_buffer.indexOf(b"\xff\xd8")
-        stream_buffer_end_index = self._stream_buffer.lastIndexOf(b"\xff\xd9")
+            self._stream_buffer_start_index = self._stream_buffer.find(b"\xff\xd8", scan_index)
+            if self._stream_buffer_start_index == -1:
+                return
+
+        # Find the last end marker after the start marker.
         # If this happens to be more than a single frame, then so be it; the JPG decoder will
         # ignore the extra data. We do it like this in order not to get a buildup of frames
-
-        if self._stream_buffer_start_index != -1 and stream_buffer_end_index != -1:
-            jpg_data = self._stream_buffer[
-                self._stream_buffer_start_index : stream_buffer_end_index + 2
-            ]
-            self._stream_buffer = self._stream_buffer[stream_buffer_end_index + 2 :]
+        stream_buffer_end_index = self._stream_buffer.rfind(
+            b"\xff\xd9", max(scan_index, self._stream_buffer_start_index + 2)
+        )
+
+        if stream_buffer_end_index != -1:
+            # Copy the frame out of the buffer only once; slicing the bytearray itself would add a second copy
+            with memoryview(self._stream_buffer) as stream_buffer_view:
+                jpg_data = bytes(
+                    stream_buffer_view[self._stream_buffer_start_index : stream_buffer_end_index + 2]
+                )
+            del self._stream_buffer[: stream_buffer_end_index + 2]
             self._stream_buffer_start_index = -1
+            self._stream_buffer_scan_index = 0
             self._image.loadFromData(jpg_data)
+            self._updateDisplayImage()
 
             if self._image.rect() != self._image_rect:
                 self.imageSizeChanged.emit()
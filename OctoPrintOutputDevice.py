@@ -17,6 +17,12 @@ from .OctoPrintOutputController import OctoPrintOutputController
 from .PowerPlugins import PowerPlugins
 from .WebcamsModel import WebcamsModel
 from .UploadOptions import UploadOptions
+from .PluginUtils import (
+    getPluginVersion,
+    jsonFromReply,
+    setFollowRedirects,
+    setHttp2Allowed,
+)
 
 try:
     # Cura 4.1 and newer
@@ -96,7 +102,7 @@ from io import StringIO, BytesIO
 from enum import IntEnum
 from collections import namedtuple
 
-from typing import cast, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
+from typing import cast, Any, Callable, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from UM.Scene.SceneNode import SceneNode  # For typing.
@@ -114,6 +120,28 @@ if i18n_catalog.hasTranslationLoaded():
     Logger.log("i", "OctoPrint Plugin translation loaded!")
 
 
+# Matches the service name of instances discovered through zeroconf, to get the name of the instance
+_zeroconf_name_regex = re.compile(r"^\"(.*)\"\._octoprint\._tcp\.local$")
+
+# Print job states by the state reported by OctoPrint
+_job_states = {
+    "Pausing": "pausing",
+    "Paused": "paused",
+    "Printing": "printing",
+    "Cancelling": "abort",
+    "Operational": "ready",
+    "Connecting": "pre_print",
+    "Sending file to SD": "pre_print",
+}  # type: Dict[str, str]
+# Print job states for reported states that are not in _job_states, by the start of the reported state
+_job_state_prefixes = (
+    ("Error", "error"),
+    ("Printing", "printing"),
+    ("Starting", "pre_print"),
+    ("Offline", "offline"),
+)
+
+
 ##  The current processing state of the backend.
 #   This shadows PrinterOutputDevice.ConnectionState because its spelling changed
 #   between Cura 4.0 beta 1 and beta 2
@@ -171,19 +199,10 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
         # We start with a single extruder, but update this when we get data from octoprint
         self._number_of_extruders_set = False
         self._number_of_extruders = 1
+        # The keys of the hotends in the temperature data, for each extruder
+        self._tool_keys = ["tool0"]  # type: List[str]
 
-        # Try to get version information from plugin.json
-        plugin_file_path = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "plugin.json"
-        )
-        try:
-            with open(plugin_file_path) as plugin_file:
-                plugin_info = json.load(plugin_file)
-                plugin_version = plugin_info["version"]
-        except:
-            # The actual version info is not critical to have so we can continue
-            plugin_version = "Unknown"
-            Logger.logException("w", "Could not get version information for the plugin")
+        plugin_version = getPluginVersion()
 
         application = CuraApplication.getInstance()
         self._user_agent = "%s/%s %s/%s" % (
@@ -191,7 +210,8 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
             application.getVersion(),
             "OctoPrintPlugin",
             plugin_version,
-        )  # NetworkedPrinterOutputDevice defines this as string, so we encode this later
+        )  # NetworkedPrinterOutputDevice defines this as string, so we encode this separately
+        self._user_agent_header = self._user_agent.encode()
 
         self._api_prefix = "api/"
         self._api_key = b""
@@ -242,7 +262,7 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
         )
 
         name = self._id
-        matches = re.search(r"^\"(.*)\"\._octoprint\._tcp.local$", name)
+        matches = _zeroconf_name_regex.search(name)
         if matches:
             name = matches.group(1)
 
@@ -266,6 +286,8 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
         self._post_gcode_reply = None
 
         self._progress_message = None  # type: Optional[Message]
+        self._upload_progress = -1  # type: int
+        self._storing_message = None  # type: Optional[Message]
         self._error_message = None  # type: Optional[Message]
         self._waiting_message = None  # type: Optional[Message]
 
@@ -274,6 +296,8 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
         # TODO; Add preference for update intervals
         self._update_fast_interval = 2000
         self._update_slow_interval = 10000
+        # While the instance keeps returning errors, the slow interval is increased up to this interval
+        self._update_max_interval = 30000
         self._update_timer = QTimer()
         self._update_timer.setInterval(self._update_fast_interval)
         self._update_timer.setSingleShot(False)
@@ -310,6 +334,63 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
 
         self._polling_end_points = ["printer", "job"]
 
+        # Handlers for finished requests, by operation and the first part of the end point
+        self._reply_handlers = {
+            (
+                QNetworkAccessManagerOperations.GetOperation,
+                "printerprofiles",
+            ): self._onPrinterProfilesReceived,
+            (
+                QNetworkAccessManagerOperations.GetOperation,
+                "printer",
+            ): self._onPrinterStateReceived,
+            (
+                QNetworkAccessManagerOperations.GetOperation,
+                "job",
+            ): self._onJobStateReceived,
+            (
+                QNetworkAccessManagerOperations.GetOperation,
+                "settings",
+            ): self._onSettingsReceived,
+            (
+                QNetworkAccessManagerOperations.GetOperation,
+                "version",
+            ): self._onVersionReceived,
+            (
+                QNetworkAccessManagerOperations.GetOperation,
+                "files",
+            ): self._onFileInfoReceived,
+            (
+                QNetworkAccessManagerOperations.PostOperation,
+                "files",
+            ): self._onFileCommandPosted,
+            (
+                QNetworkAccessManagerOperations.PostOperation,
+                "job",
+            ): self._onJobCommandPosted,
+            (
+                QNetworkAccessManagerOperations.PostOperation,
+                "printer",
+            ): self._onGcodeCommandPosted,
+            (
+                QNetworkAccessManagerOperations.PostOperation,
+                "login",
+            ): self._onLoginPosted,
+            (
+                QNetworkAccessManagerOperations.PostOperation,
+                "connection",
+            ): self._onConnectionCommandPosted,
+        }  # type: Dict[Tuple[Any, str], Callable[[QNetworkReply, int, str], bool]]
+        # Parsed urls of the end points that are polled, so they are not parsed again for every poll
+        self._polling_urls = {
+            end_point: QUrl(self._api_url + end_point)
+            for end_point in self._polling_end_points
+        }  # type: Dict[str, QUrl]
+        # The last polling reply and the time it was requested, by end point
+        self._polling_replies = {}  # type: Dict[str, Tuple[QNetworkReply, float]]
+        # Polling replies that are still running after this many seconds are abandoned
+        self._polling_reply_timeout = 30
+
     @property
     def _store_on_sd(self) -> bool:
         global_container_stack = CuraApplication.getInstance().getGlobalContainerStack()
@@ -439,8 +520,22 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
         return self._confirm_upload_options
 
     def _update(self) -> None:
+        now = time()
         for end_point in self._polling_end_points:
-            self.get(end_point, self._onRequestFinished)
+            # Do not pile up requests if the instance has not answered the previous request for an end point yet
+            reply, request_time = self._polling_replies.get(end_point, (None, 0.0))
+            if reply is not None:
+                try:
+                    if reply.isRunning():
+                        if now - request_time < self._polling_reply_timeout:
+                            continue
+                        reply.abort()
+                except RuntimeError:
+                    pass  # It can happen that the wrapped c++ object is already deleted.
+
+            reply = self.get(end_point, self._onRequestFinished)
+            if reply is not None:
+                self._polling_replies[end_point] = (reply, now)
 
     def close(self) -> None:
         if self._update_timer:
@@ -464,6 +559,7 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
             for point in self._polling_end_points
             if not point.startswith("files/")
         ]
+        self._polling_replies = {}  # type: Dict[str, Tuple[QNetworkReply, float]]
 
     ##  Start requesting data from the instance
     def connect(self) -> None:
@@ -480,6 +576,8 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
             self._id,
             self._base_url,
         )
+        # Start polling at the normal pace, regardless of any back off after errors in an earlier connection
+        self._update_timer.setInterval(self._update_fast_interval)
         self._update_timer.start()
 
         self._last_response_time = None  # type: Optional[float]
@@ -780,6 +878,7 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
                 # stopPreheatTimers was added after Cura 3.3 beta
                 pass
 
+        self._upload_progress = -1
         self._progress_message = Message(
             i18n_catalog.i18nc("@info:status", "Sending data to OctoPrint..."),
             title=i18n_catalog.i18nc("@label", "OctoPrint"),
@@ -818,6 +917,8 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
 
         ##  Create parts (to be placed inside multipart)
         gcode_body = self._gcode_stream.getvalue()
+        # release the buffer of the stream now, so it does not add to the peak memory use while the parts are created
+        self._gcode_stream = StringIO()  # type: Union[StringIO, BytesIO]
         if isinstance(gcode_body, str):
             # encode StringIO result to bytes
             gcode_body = gcode_body.encode()
@@ -834,6 +935,7 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
                 "application/octet-stream",
             )
         )
+        del gcode_body  # the form part holds its own copy of the data
 
         if self._store_on_sd or (
             not self._wait_for_analysis and not self._transfer_as_ufp
@@ -880,8 +982,6 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
             self._error_message.show()
             Logger.log("e", "An exception occurred in network connection: %s" % str(e))
 
-        self._gcode_stream = StringIO()  # type: Union[StringIO, BytesIO]
-
     def _cancelSendGcode(self, message: Message, action_id: str) -> None:
         self._progress_message = None  # type:Optional[Message]
         if message:
@@ -898,8 +998,10 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
             self._post_gcode_reply = None  # type:Optional[QNetworkReply]
 
     def sendCommand(self, command: str) -> None:
+        if not self._queued_gcode_commands:
+            # Commands queued before the batch is sent are added to the same batch
+            CuraApplication.getInstance().callLater(self._sendQueuedGcode)
         self._queued_gcode_commands.append(command)
-        CuraApplication.getInstance().callLater(self._sendQueuedGcode)
 
     # Send gcode commands that are queued in quick succession as a single batch
     def _sendQueuedGcode(self) -> None:
@@ -933,6 +1035,8 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
             Logger.log("w", "Received a timeout on a request to the instance")
             self._connection_state_before_timeout = self._connection_state
             self.setConnectionState(cast(ConnectionState, UnifiedConnectionState.Error))
+            if self._getEndPoint(reply) == "printer":
+                self._backOffUpdates()
             return
 
         if (
@@ -952,587 +1056,596 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
         if reply.error() == QNetworkReplyNetworkErrors.NoError:
             self._last_response_time = time()
 
+        end_point = self._getEndPoint(reply)
+
         http_status_code = reply.attribute(QNetworkRequestAttributes.HttpStatusCodeAttribute)
         if not http_status_code:
-            # Received no or empty reply
+            # Received no or empty reply, eg because the instance can not be reached or the request was aborted
+            if end_point == "printer":
+                self._backOffUpdates()
             return
 
-        content_type = bytes(reply.rawHeader(b"Content-Type")).decode("utf-8")
+        operation = reply.operation()
+        if (
+            operation != QNetworkAccessManagerOperations.GetOperation
+            and operation != QNetworkAccessManagerOperations.PostOperation
+        ):
+            Logger.log(
+                "d",
+                "OctoPrintOutputDevice got an unhandled operation %s",
+                operation,
+            )
+        else:
+            handler = self._reply_handlers.get(
+                (operation, end_point.split("/", 1)[0]), None
+            )
+            if handler and handler(reply, http_status_code, end_point):
+                return
 
-        if reply.operation() == QNetworkAccessManagerOperations.GetOperation:
-            if self._api_prefix + "printerprofiles" in reply.url().toString():
-                if http_status_code == 200:
-                    try:
-                        json_data = json.loads(bytes(reply.readAll()).decode("utf-8"))
-                    except json.decoder.JSONDecodeError:
-                        Logger.log(
-                            "w", "Received invalid JSON from octoprint instance."
-                        )
-                        json_data = {}
-
-                    for profile_id in json_data["profiles"]:
-                        printer_profile = json_data["profiles"][profile_id]
-                        if printer_profile.get("current", False):
-                            self._printer_name = printer_profile.get("name", "")
-                            self._printer_model = printer_profile.get("model", "")
-
-                            try:
-                                for axis in ["x", "y", "z", "e"]:
-                                    self._axis_information[axis] = AxisInformation(
-                                        speed=printer_profile["axes"][axis]["speed"],
-                                        inverted=printer_profile["axes"][axis]["inverted"],
-                                    )
-                            except KeyError:
-                                Logger.log(
-                                    "w", "Unable to retreive axes information from OctoPrint printer profile."
-                                )
-
-                            self.additionalDataChanged.emit()
-                            return
+        if http_status_code >= 400:
+            if http_status_code == 401 or http_status_code == 403:
+                error_string = i18n_catalog.i18nc(
+                    "@info:error",
+                    "You are not allowed to access OctoPrint with the configured API key.",
+                )
+            else:
+                # Received another error reply
+                content_type = bytes(reply.rawHeader(b"Content-Type")).decode("utf-8")
+                if content_type == "text/plain":
+                    error_string = self._errorStringFromReply(reply)
                 else:
-                    Logger.log(
-                        "w",
-                        "Instance does not report printerprofiles with provided API key",
+                    error_string = i18n_catalog.i18nc(
+                        "@info:error",
+                        "OctoPrint responded with an unknown error",
                     )
-                    return
-
-            elif (
-                self._api_prefix + "printer" in reply.url().toString()
-            ):  # Status update from /printer.
-                if not self._printers:
-                    self._createPrinterList()
-
-                # An OctoPrint instance has a single printer.
-                printer = self._printers[0]
-                if not printer:
-                    Logger.log("e", "There is no active printer")
-                    return
-                update_pace = self._update_slow_interval
-
-                if http_status_code == 200:
-                    update_pace = self._update_fast_interval
-
-                    if not self.acceptsCommands:
-                        self._setAcceptsCommands(True)
-                        self.setConnectionText(
-                            i18n_catalog.i18nc(
-                                "@info:status", "Connected to OctoPrint on {0}"
-                            ).format(self._id)
-                        )
 
-                    if self._connection_state == UnifiedConnectionState.Connecting:
-                        self.setConnectionState(
-                            cast(ConnectionState, UnifiedConnectionState.Connected)
-                        )
+            self._showErrorMessage(error_string)
+            Logger.log(
+                "e",
+                "OctoPrintOutputDevice got an error while accessing %s",
+                reply.url().toString(),
+            )
+            Logger.log("e", error_string)
+
+    ##  Get the part of the url of a reply after the api prefix, eg "printer" or "files/local/file.gcode"
+    def _getEndPoint(self, reply: QNetworkReply) -> str:
+        url = reply.url().toString()
+        if url.startswith(self._api_url):
+            return url[len(self._api_url) :]
+        # eg when the request was redirected
+        return url.partition("/" + self._api_prefix)[2]
+
+    ##  Handler for the printer profiles from /printerprofiles
+    #   \return True if the reply has been handled, False to continue with the generic error handling
+    def _onPrinterProfilesReceived(
+        self, reply: QNetworkReply, http_status_code: int, end_point: str
+    ) -> bool:
+        if http_status_code == 200:
+            json_data = jsonFromReply(reply)
+
+            for profile_id in json_data["profiles"]:
+                printer_profile = json_data["profiles"][profile_id]
+                if printer_profile.get("current", False):
+                    self._printer_name = printer_profile.get("name", "")
+                    self._printer_model = printer_profile.get("model", "")
+
                     try:
-                        json_data = json.loads(bytes(reply.readAll()).decode("utf-8"))
-                    except json.decoder.JSONDecodeError:
+                        for axis in ["x", "y", "z", "e"]:
+                            self._axis_information[axis] = AxisInformation(
+                                speed=printer_profile["axes"][axis]["speed"],
+                                inverted=printer_profile["axes"][axis]["inverted"],
+                            )
+                    except KeyError:
                         Logger.log(
-                            "w", "Received invalid JSON from octoprint instance."
+                            "w", "Unable to retreive axes information from OctoPrint printer profile."
                         )
-                        json_data = {}
-
-                    if "temperature" in json_data:
-                        if not self._number_of_extruders_set:
-                            self._number_of_extruders = 0
-                            while (
-                                "tool%d" % self._number_of_extruders
-                                in json_data["temperature"]
-                            ):
-                                self._number_of_extruders += 1
-
-                            if self._number_of_extruders > 1:
-                                # Recreate list of printers to match the new _number_of_extruders
-                                self._createPrinterList()
-                                printer = self._printers[0]
-
-                            if self._number_of_extruders > 0:
-                                self._number_of_extruders_set = True
-
-                        # Check for hotend temperatures
-                        for index in range(0, self._number_of_extruders):
-                            extruder = printer.extruders[index]
-                            if ("tool%d" % index) in json_data["temperature"]:
-                                hotend_temperatures = json_data["temperature"][
-                                    "tool%d" % index
-                                ]
-                                target_temperature = (
-                                    hotend_temperatures["target"]
-                                    if hotend_temperatures["target"] is not None
-                                    else -1
-                                )
-                                actual_temperature = (
-                                    hotend_temperatures["actual"]
-                                    if hotend_temperatures["actual"] is not None
-                                    else -1
-                                )
-                                extruder.updateTargetHotendTemperature(
-                                    target_temperature
-                                )
-                                extruder.updateHotendTemperature(actual_temperature)
-                            else:
-                                extruder.updateTargetHotendTemperature(0)
-                                extruder.updateHotendTemperature(0)
-
-                        if "bed" in json_data["temperature"]:
-                            bed_temperatures = json_data["temperature"]["bed"]
-                            actual_temperature = (
-                                bed_temperatures["actual"]
-                                if bed_temperatures["actual"] is not None
-                                else -1
-                            )
-                            printer.updateBedTemperature(actual_temperature)
-                            target_temperature = (
-                                bed_temperatures["target"]
-                                if bed_temperatures["target"] is not None
-                                else -1
-                            )
-                            printer.updateTargetBedTemperature(target_temperature)
-                        else:
-                            printer.updateBedTemperature(-1)
-                            printer.updateTargetBedTemperature(0)
-
-                    printer_state = "offline"
-                    if "state" in json_data:
-                        flags = json_data["state"]["flags"]
-                        if flags["error"] or flags["closedOrError"]:
-                            printer_state = "error"
-                        elif flags["paused"] or flags["pausing"]:
-                            printer_state = "paused"
-                        elif flags["printing"]:
-                            printer_state = "printing"
-                        elif flags["cancelling"]:
-                            printer_state = "aborted"
-                        elif flags["ready"] or flags["operational"]:
-                            printer_state = "idle"
-                        else:
-                            Logger.log(
-                                "w",
-                                "Encountered unexpected printer state flags: %s"
-                                % flags,
-                            )
-                    printer.updateState(printer_state)
 
-                elif http_status_code == 401 or http_status_code == 403:
-                    self._setOffline(
-                        printer,
-                        i18n_catalog.i18nc(
-                            "@info:status",
-                            "OctoPrint on {0} does not allow access to the printer state",
-                        ).format(self._id),
-                    )
-                    return
+                    self.additionalDataChanged.emit()
+                    return True
+        else:
+            Logger.log(
+                "w",
+                "Instance does not report printerprofiles with provided API key",
+            )
+            return True
 
-                elif http_status_code == 409:
-                    if self._connection_state == UnifiedConnectionState.Connecting:
-                        self.setConnectionState(
-                            cast(ConnectionState, UnifiedConnectionState.Connected)
-                        )
+        return False
 
-                    self._setOffline(
-                        printer,
-                        i18n_catalog.i18nc(
-                            "@info:status",
-                            "The printer connected to OctoPrint on {0} is not operational",
-                        ).format(self._id),
-                    )
-                    return
+    ##  Handler for status updates from /printer
+    #   \return True if the reply has been handled, False to continue with the generic error handling
+    def _onPrinterStateReceived(
+        self, reply: QNetworkReply, http_status_code: int, end_point: str
+    ) -> bool:
+        if not self._printers:
+            self._createPrinterList()
 
-                elif http_status_code == 502 or http_status_code == 503:
-                    Logger.log(
-                        "w", "Received an error status code: %d", http_status_code
+        # An OctoPrint instance has a single printer.
+        printer = self._printers[0]
+        if not printer:
+            Logger.log("e", "There is no active printer")
+            return True
+
+        if http_status_code == 200:
+            if self._update_timer.interval() != self._update_fast_interval:
+                self._update_timer.setInterval(self._update_fast_interval)
+
+            if not self.acceptsCommands:
+                self._setAcceptsCommands(True)
+                self.setConnectionText(
+                    i18n_catalog.i18nc(
+                        "@info:status", "Connected to OctoPrint on {0}"
+                    ).format(self._id)
+                )
+
+            if self._connection_state == UnifiedConnectionState.Connecting:
+                self.setConnectionState(
+                    cast(ConnectionState, UnifiedConnectionState.Connected)
+                )
+            json_data = jsonFromReply(reply)
+
+            temperature_data = json_data.get("temperature", None)
+            if temperature_data is not None:
+                if not self._number_of_extruders_set:
+                    self._number_of_extruders = 0
+                    while "tool%d" % self._number_of_extruders in temperature_data:
+                        self._number_of_extruders += 1
+                    self._tool_keys = [
+                        "tool%d" % index
+                        for index in range(0, self._number_of_extruders)
+                    ]
+
+                    if self._number_of_extruders > 1:
+                        # Recreate list of printers to match the new _number_of_extruders
+                        self._createPrinterList()
+                        printer = self._printers[0]
+
+                    if self._number_of_extruders > 0:
+                        self._number_of_extruders_set = True
+
+                # Check for hotend temperatures
+                for index, tool_key in enumerate(self._tool_keys):
+                    extruder = printer.extruders[index]
+                    hotend_temperatures = temperature_data.get(tool_key, None)
+                    if hotend_temperatures is not None:
+                        target_temperature = hotend_temperatures.get("target", None)
+                        actual_temperature = hotend_temperatures.get("actual", None)
+                        extruder.updateTargetHotendTemperature(
+                            target_temperature if target_temperature is not None else -1
+                        )
+                        extruder.updateHotendTemperature(
+                            actual_temperature if actual_temperature is not None else -1
+                        )
+                    else:
+                        extruder.updateTargetHotendTemperature(0)
+                        extruder.updateHotendTemperature(0)
+
+                bed_temperatures = temperature_data.get("bed", None)
+                if bed_temperatures is not None:
+                    actual_temperature = bed_temperatures.get("actual", None)
+                    printer.updateBedTemperature(
+                        actual_temperature if actual_temperature is not None else -1
                     )
-                    self._setOffline(
-                        printer,
-                        i18n_catalog.i18nc(
-                            "@info:status", "OctoPrint on {0} is not running"
-                        ).format(self._id),
+                    target_temperature = bed_temperatures.get("target", None)
+                    printer.updateTargetBedTemperature(
+                        target_temperature if target_temperature is not None else -1
                     )
-                    return
-
                 else:
-                    self._setOffline(printer)
+                    printer.updateBedTemperature(-1)
+                    printer.updateTargetBedTemperature(0)
+
+            printer_state = "offline"
+            state_data = json_data.get("state", None)
+            if state_data is not None:
+                flags = state_data["flags"]
+                if flags["error"] or flags["closedOrError"]:
+                    printer_state = "error"
+                elif flags["paused"] or flags["pausing"]:
+                    printer_state = "paused"
+                elif flags["printing"]:
+                    printer_state = "printing"
+                elif flags["cancelling"]:
+                    printer_state = "aborted"
+                elif flags["ready"] or flags["operational"]:
+                    printer_state = "idle"
+                else:
                     Logger.log(
-                        "w", "Received an unexpected status code: %d", http_status_code
+                        "w",
+                        "Encountered unexpected printer state flags: %s"
+                        % flags,
                     )
+            printer.updateState(printer_state)
 
-                if update_pace != self._update_timer.interval():
-                    self._update_timer.setInterval(update_pace)
+        elif http_status_code == 401 or http_status_code == 403:
+            self._setOffline(
+                printer,
+                i18n_catalog.i18nc(
+                    "@info:status",
+                    "OctoPrint on {0} does not allow access to the printer state",
+                ).format(self._id),
+            )
+            return True
 
-            elif (
-                self._api_prefix + "job" in reply.url().toString()
-            ):  # Status update from /job:
-                if not self._printers or not self._printers[0]:
-                    return  # Ignore the data for now, we don't have info about a printer yet.
-                printer = self._printers[0]
+        elif http_status_code == 409:
+            if self._connection_state == UnifiedConnectionState.Connecting:
+                self.setConnectionState(
+                    cast(ConnectionState, UnifiedConnectionState.Connected)
+                )
 
-                if http_status_code == 200:
-                    try:
-                        json_data = json.loads(bytes(reply.readAll()).decode("utf-8"))
-                    except json.decoder.JSONDecodeError:
+            self._setOffline(
+                printer,
+                i18n_catalog.i18nc(
+                    "@info:status",
+                    "The printer connected to OctoPrint on {0} is not operational",
+                ).format(self._id),
+            )
+            return True
+
+        elif http_status_code == 502 or http_status_code == 503:
+            Logger.log(
+                "w", "Received an error status code: %d", http_status_code
+            )
+            self._setOffline(
+                printer,
+                i18n_catalog.i18nc(
+                    "@info:status", "OctoPrint on {0} is not running"
+                ).format(self._id),
+            )
+            self._backOffUpdates()
+            return True
+
+        else:
+            self._setOffline(printer)
+            Logger.log(
+                "w", "Received an unexpected status code: %d", http_status_code
+            )
+
+            self._backOffUpdates()
+
+        return False
+
+    ##  Poll less often while the instance does not respond or keeps returning errors
+    def _backOffUpdates(self) -> None:
+        self._update_timer.setInterval(
+            min(
+                max(
+                    int(self._update_timer.interval() * 1.5),
+                    self._update_slow_interval,
+                ),
+                self._update_max_interval,
+            )
+        )
+
+    ##  Handler for status updates from /job
+    #   \return True if the reply has been handled, False to continue with the generic error handling
+    def _onJobStateReceived(
+        self, reply: QNetworkReply, http_status_code: int, end_point: str
+    ) -> bool:
+        if not self._printers or not self._printers[0]:
+            return True  # Ignore the data for now, we don't have info about a printer yet.
+        printer = self._printers[0]
+
+        if http_status_code == 200:
+            json_data = jsonFromReply(reply)
+
+            if printer.activePrintJob is None:
+                print_job = PrintJobOutputModel(
+                    output_controller=self._output_controller
+                )
+                printer.updateActivePrintJob(print_job)
+            else:
+                print_job = printer.activePrintJob
+
+            print_job_state = "offline"
+            state = json_data.get("state", None)
+            if state is not None:
+                if not isinstance(state, str):
+                    Logger.log(
+                        "e", "Encountered non-string print job state: %s" % state
+                    )
+                else:
+                    job_state = _job_states.get(state, None)
+                    if job_state is None:
+                        # States such as "Printing from SD" or "Offline after error" are matched by their start
+                        for state_prefix, prefixed_job_state in _job_state_prefixes:
+                            if state.startswith(state_prefix):
+                                job_state = prefixed_job_state
+                                break
+                    if job_state is not None:
+                        print_job_state = job_state
+                        if state == "Operational":
+                            printer.updateState("idle")
+                    else:
                         Logger.log(
-                            "w", "Received invalid JSON from octoprint instance."
+                            "w", "Encountered unexpected print job state: %s" % state
                         )
-                        json_data = {}
+            print_job.updateState(print_job_state)
+
+            if "progress" in json_data:
+                print_time = json_data["progress"]["printTime"]
+                completion = json_data["progress"]["completion"]
 
-                    if printer.activePrintJob is None:
-                        print_job = PrintJobOutputModel(
-                            output_controller=self._output_controller
+                if print_time:
+                    print_job.updateTimeElapsed(print_time)
+
+                    print_time_left = json_data["progress"]["printTimeLeft"]
+                    if print_time_left:  # not 0 or None or ""
+                        print_job.updateTimeTotal(print_time + print_time_left)
+                    elif completion:  # not 0 or None or ""
+                        print_job.updateTimeTotal(
+                            int(print_time / (completion / 100))
                         )
-                        printer.updateActivePrintJob(print_job)
                     else:
-                        print_job = printer.activePrintJob
-
-                    print_job_state = "offline"
-                    if "state" in json_data:
-                        state = json_data["state"]
-                        if not isinstance(state, str):
-                            Logger.log(
-                                "e", "Encountered non-string print job state: %s" % state
-                            )
-                        elif state.startswith("Error"):
-                            print_job_state = "error"
-                        elif state == "Pausing":
-                            print_job_state = "pausing"
-                        elif state == "Paused":
-                            print_job_state = "paused"
-                        elif state.startswith("Printing"):
-                            print_job_state = "printing"
-                        elif state == "Cancelling":
-                            print_job_state = "abort"
-                        elif state == "Operational":
-                            print_job_state = "ready"
-                            printer.updateState("idle")
-                        elif (
-                            state.startswith("Starting")
-                            or state == "Connecting"
-                            or state == "Sending file to SD"
-                        ):
-                            print_job_state = "pre_print"
-                        elif state.startswith("Offline"):
-                            print_job_state = "offline"
-                        else:
-                            Logger.log(
-                                "w", "Encountered unexpected print job state: %s" % state
-                            )
-                    print_job.updateState(print_job_state)
-
-                    if "progress" in json_data:
-                        print_time = json_data["progress"]["printTime"]
-                        completion = json_data["progress"]["completion"]
-
-                        if print_time:
-                            print_job.updateTimeElapsed(print_time)
-
-                            print_time_left = json_data["progress"]["printTimeLeft"]
-                            if print_time_left:  # not 0 or None or ""
-                                print_job.updateTimeTotal(print_time + print_time_left)
-                            elif completion:  # not 0 or None or ""
-                                print_job.updateTimeTotal(
-                                    int(print_time / (completion / 100))
-                                )
-                            else:
-                                print_job.updateTimeTotal(0)
-                        else:
-                            print_job.updateTimeElapsed(0)
-                            print_job.updateTimeTotal(0)
-
-                    if (
-                        completion and print_job_state == "pre_print"
-                    ):  # completion not not 0 or None or "", state "Sending file to SD"
-                        if not self._progress_message:
-                            self._progress_message = Message(
-                                i18n_catalog.i18nc(
-                                    "@info:status",
-                                    "Streaming file to the SD card of the printer...",
-                                ),
-                                0,
-                                False,
-                                -1,
-                                title=i18n_catalog.i18nc("@label", "OctoPrint"),
-                            )
-                            self._progress_message.show()
-                        if completion < 100:
-                            self._progress_message.setProgress(completion)
-                    else:
-                        if (
-                            self._progress_message
-                            and self._progress_message.getText().startswith(
-                                i18n_catalog.i18nc(
-                                    "@info:status",
-                                    "Streaming file to the SD card of the printer...",
-                                )
-                            )
-                        ):
-                            self._progress_message.hide()
-                            self._progress_message = None  # type:Optional[Message]
-
-                    print_job.updateName(json_data["job"]["file"]["name"])
-
-                    if self._waiting_for_printer and printer.state == "idle":
-                        self._waiting_for_printer = False
-                        if self._waiting_message:
-                            self._waiting_message.hide()
-                        self._waiting_message = None
-                        self._sendPrintJob()
-
-                elif http_status_code == 401 or http_status_code == 403:
-                    self._setOffline(
-                        printer,
+                        print_job.updateTimeTotal(0)
+                else:
+                    print_job.updateTimeElapsed(0)
+                    print_job.updateTimeTotal(0)
+
+            if (
+                completion and print_job_state == "pre_print"
+            ):  # completion not not 0 or None or "", state "Sending file to SD"
+                if not self._progress_message:
+                    self._progress_message = Message(
                         i18n_catalog.i18nc(
                             "@info:status",
-                            "OctoPrint on {0} does not allow access to the job state",
-                        ).format(self._id),
+                            "Streaming file to the SD card of the printer...",
+                        ),
+                        0,
+                        False,
+                        -1,
+                        title=i18n_catalog.i18nc("@label", "OctoPrint"),
                     )
-                    return
-
-                elif http_status_code == 502 or http_status_code == 503:
-                    Logger.log(
-                        "w", "Received an error status code: %d", http_status_code
-                    )
-                    self._setOffline(
-                        printer,
+                    self._progress_message.show()
+                if completion < 100:
+                    self._progress_message.setProgress(completion)
+            else:
+                if (
+                    self._progress_message
+                    and self._progress_message.getText().startswith(
                         i18n_catalog.i18nc(
-                            "@info:status", "OctoPrint on {0} is not running"
-                        ).format(self._id),
+                            "@info:status",
+                            "Streaming file to the SD card of the printer...",
+                        )
                     )
-                    return
+                ):
+                    self._progress_message.hide()
+                    self._progress_message = None  # type:Optional[Message]
 
-                else:
-                    pass  # See generic error handler below
+            print_job.updateName(json_data["job"]["file"]["name"])
 
-            elif (
-                self._api_prefix + "settings" in reply.url().toString()
-            ):  # OctoPrint settings dump from /settings:
-                if http_status_code == 200:
-                    try:
-                        json_data = json.loads(bytes(reply.readAll()).decode("utf-8"))
-                    except json.decoder.JSONDecodeError:
-                        Logger.log(
-                            "w", "Received invalid JSON from octoprint instance."
-                        )
-                        json_data = {}
+            if self._waiting_for_printer and printer.state == "idle":
+                self._waiting_for_printer = False
+                if self._waiting_message:
+                    self._waiting_message.hide()
+                self._waiting_message = None
+                self._sendPrintJob()
 
-                    self.parseSettingsData(json_data)
+        elif http_status_code == 401 or http_status_code == 403:
+            self._setOffline(
+                printer,
+                i18n_catalog.i18nc(
+                    "@info:status",
+                    "OctoPrint on {0} does not allow access to the job state",
+                ).format(self._id),
+            )
+            return True
 
-            elif (
-                self._api_prefix + "version" in reply.url().toString()
-            ):  # OctoPrint & API version
-                if http_status_code == 200:
-                    try:
-                        json_data = json.loads(bytes(reply.readAll()).decode("utf-8"))
-                    except json.decoder.JSONDecodeError:
-                        Logger.log(
-                            "w", "Received invalid JSON from octoprint instance."
-                        )
-                        json_data = {}
+        elif http_status_code == 502 or http_status_code == 503:
+            Logger.log(
+                "w", "Received an error status code: %d", http_status_code
+            )
+            self._setOffline(
+                printer,
+                i18n_catalog.i18nc(
+                    "@info:status", "OctoPrint on {0} is not running"
+                ).format(self._id),
+            )
+            return True
 
-                    if "server" in json_data:
-                        self._octoprint_version = json_data["server"]
-                        self.additionalDataChanged.emit()
+        else:
+            pass  # See generic error handler below
 
-                elif http_status_code == 404:
-                    Logger.log("w", "Instance does not support reporting its version")
-                    return
+        return False
 
-            elif (
-                self._api_prefix + "files/" in reply.url().toString()
-            ):  # Information about a file
-                if http_status_code == 200:
-                    if not self._waiting_for_analysis:
-                        return
+    ##  Handler for the OctoPrint settings dump from /settings
+    #   \return True if the reply has been handled, False to continue with the generic error handling
+    def _onSettingsReceived(
+        self, reply: QNetworkReply, http_status_code: int, end_point: str
+    ) -> bool:
+        if http_status_code == 200:
+            json_data = jsonFromReply(reply)
 
-                    end_point = reply.url().toString().split(self._api_prefix, 1)[1]
+            self.parseSettingsData(json_data)
 
-                    try:
-                        json_data = json.loads(bytes(reply.readAll()).decode("utf-8"))
-                    except json.decoder.JSONDecodeError:
-                        Logger.log(
-                            "w", "Received invalid JSON from octoprint instance."
-                        )
-                        json_data = {}
+        return False
 
-                    if (
-                        "gcodeAnalysis" in json_data
-                        and "progress" in json_data["gcodeAnalysis"]
-                    ):
-                        Logger.log(
-                            "d", "PrintTimeGenius analysis of %s is done" % end_point
-                        )
+    ##  Handler for the OctoPrint & API version from /version
+    #   \return True if the reply has been handled, False to continue with the generic error handling
+    def _onVersionReceived(
+        self, reply: QNetworkReply, http_status_code: int, end_point: str
+    ) -> bool:
+        if http_status_code == 200:
+            json_data = jsonFromReply(reply)
 
-                        self._waiting_for_analysis = False
+            if "server" in json_data:
+                self._octoprint_version = json_data["server"]
+                self.additionalDataChanged.emit()
 
-                        if self._waiting_message:
-                            self._waiting_message.hide()
-                            self._waiting_message = None
+        elif http_status_code == 404:
+            Logger.log("w", "Instance does not support reporting its version")
+            return True
 
-                        self._polling_end_points = [
-                            point
-                            for point in self._polling_end_points
-                            if not point.startswith("files/")
-                        ]
+        return False
 
-                        self._selectAndPrint(end_point)
-                    else:
-                        Logger.log(
-                            "d",
-                            "Still waiting for PrintTimeGenius analysis of %s"
-                            % end_point,
-                        )
+    ##  Handler for information about a file from /files/
+    #   \return True if the reply has been handled, False to continue with the generic error handling
+    def _onFileInfoReceived(
+        self, reply: QNetworkReply, http_status_code: int, end_point: str
+    ) -> bool:
+        if http_status_code == 200:
+            if not self._waiting_for_analysis:
+                return True
 
-        elif reply.operation() == QNetworkAccessManagerOperations.PostOperation:
-            if (
-                self._api_prefix + "files" in reply.url().toString()
-            ):  # Result from /files command to start a print job:
-                if http_status_code == 204:
-                    Logger.log("d", "OctoPrint file command accepted")
+            json_data = jsonFromReply(reply)
 
-                elif http_status_code == 401 or http_status_code == 403:
-                    error_string = i18n_catalog.i18nc(
-                        "@info:error",
-                        "You are not allowed to start print jobs on OctoPrint with the configured API key.",
-                    )
-                    self._showErrorMessage(error_string)
-                    return
+            if (
+                "gcodeAnalysis" in json_data
+                and "progress" in json_data["gcodeAnalysis"]
+            ):
+                Logger.log(
+                    "d", "PrintTimeGenius analysis of %s is done" % end_point
+                )
 
-                elif (
-                    http_status_code == 404
-                    and "files/sdcard/" in reply.url().toString()
-                ):
-                    Logger.log(
-                        "d",
-                        "OctoPrint reports an 404 not found error after uploading to SD card, but we ignore that",
-                    )
-                    return
+                self._waiting_for_analysis = False
 
-                else:
-                    pass  # See generic error handler below
+                if self._waiting_message:
+                    self._waiting_message.hide()
+                    self._waiting_message = None
 
-            elif (
-                self._api_prefix + "job" in reply.url().toString()
-            ):  # Result from /job command (eg start/pause):
-                if http_status_code == 204:
-                    Logger.log("d", "OctoPrint job command accepted")
+                self._polling_end_points = [
+                    point
+                    for point in self._polling_end_points
+                    if not point.startswith("files/")
+                ]
 
-                elif http_status_code == 401 or http_status_code == 403:
-                    error_string = i18n_catalog.i18nc(
-                        "@info:error",
-                        "You are not allowed to control print jobs on OctoPrint with the configured API key.",
-                    )
-                    self._showErrorMessage(error_string)
-                    return
+                self._selectAndPrint(end_point)
+            else:
+                Logger.log(
+                    "d",
+                    "Still waiting for PrintTimeGenius analysis of %s"
+                    % end_point,
+                )
 
-                else:
-                    pass  # See generic error handler below
+        return False
 
-            elif (
-                self._api_prefix + "printer/command" in reply.url().toString()
-            ):  # Result from /printer/command (gcode statements):
-                if http_status_code == 204:
-                    Logger.log("d", "OctoPrint gcode command(s) accepted")
+    ##  Handler for the result of a /files command to start a print job
+    #   \return True if the reply has been handled, False to continue with the generic error handling
+    def _onFileCommandPosted(
+        self, reply: QNetworkReply, http_status_code: int, end_point: str
+    ) -> bool:
+        if http_status_code == 204:
+            Logger.log("d", "OctoPrint file command accepted")
 
-                elif http_status_code == 401 or http_status_code == 403:
-                    error_string = i18n_catalog.i18nc(
-                        "@info:error",
-                        "You are not allowed to send gcode commands to OctoPrint with the configured API key.",
-                    )
-                    self._showErrorMessage(error_string)
-                    return
+        elif http_status_code == 401 or http_status_code == 403:
+            error_string = i18n_catalog.i18nc(
+                "@info:error",
+                "You are not allowed to start print jobs on OctoPrint with the configured API key.",
+            )
+            self._showErrorMessage(error_string)
+            return True
 
-                else:
-                    pass  # See generic error handler below
+        elif http_status_code == 404 and end_point.startswith("files/sdcard/"):
+            Logger.log(
+                "d",
+                "OctoPrint reports an 404 not found error after uploading to SD card, but we ignore that",
+            )
+            return True
 
-            elif self._api_prefix + "login" in reply.url().toString():
-                if http_status_code == 200:
-                    try:
-                        json_data = json.loads(bytes(reply.readAll()).decode("utf-8"))
-                    except json.decoder.JSONDecodeError:
-                        Logger.log(
-                            "w", "Received invalid JSON from octoprint instance."
-                        )
-                        json_data = {}
+        else:
+            pass  # See generic error handler below
 
-                    if "name" in json_data:
-                        self._octoprint_user_name = json_data["name"]
-                    else:
-                        self._octoprint_user_name = i18n_catalog.i18nc(
-                            "@label", "Anonymous user"
-                        )
-                    self.additionalDataChanged.emit()
+        return False
 
-                elif http_status_code == 404:
-                    Logger.log("w", "Instance does not support user authorization")
-                    self._octoprint_user_name = i18n_catalog.i18nc(
-                        "@label", "Anonymous user"
-                    )
-                    self.additionalDataChanged.emit()
-                    return
+    ##  Handler for the result of a /job command (eg start/pause)
+    #   \return True if the reply has been handled, False to continue with the generic error handling
+    def _onJobCommandPosted(
+        self, reply: QNetworkReply, http_status_code: int, end_point: str
+    ) -> bool:
+        if http_status_code == 204:
+            Logger.log("d", "OctoPrint job command accepted")
 
-                elif http_status_code == 401 or http_status_code == 403:
-                    self._octoprint_user_name = i18n_catalog.i18nc(
-                        "@label", "Unknown user"
-                    )
-                    self.additionalDataChanged.emit()
+        elif http_status_code == 401 or http_status_code == 403:
+            error_string = i18n_catalog.i18nc(
+                "@info:error",
+                "You are not allowed to control print jobs on OctoPrint with the configured API key.",
+            )
+            self._showErrorMessage(error_string)
+            return True
 
-                    error_string = i18n_catalog.i18nc(
-                        "@info:error",
-                        "You are not allowed to access to OctoPrint with the configured API key.",
-                    )
-                    self._showErrorMessage(error_string)
-                    return
+        else:
+            pass  # See generic error handler below
 
-            elif (
-                self._api_prefix + "connection/connect" in reply.url().toString()
-            ):  # Result from /connection/connect command (eg start/pause):
-                if http_status_code == 204:
-                    Logger.log("d", "OctoPrint connection command accepted")
+        return False
 
-                elif http_status_code == 401 or http_status_code == 403:
-                    error_string = i18n_catalog.i18nc(
-                        "@info:error",
-                        "You are not allowed to control printer connections on OctoPrint with the configured API key.",
-                    )
-                    self._showErrorMessage(error_string)
-                    return
+    ##  Handler for the result of /printer/command (gcode statements)
+    #   \return True if the reply has been handled, False to continue with the generic error handling
+    def _onGcodeCommandPosted(
+        self, reply: QNetworkReply, http_status_code: int, end_point: str
+    ) -> bool:
+        if http_status_code == 204:
+            Logger.log("d", "OctoPrint gcode command(s) accepted")
 
-                else:
-                    pass  # See generic error handler below
+        elif http_status_code == 401 or http_status_code == 403:
+            error_string = i18n_catalog.i18nc(
+                "@info:error",
+                "You are not allowed to send gcode commands to OctoPrint with the configured API key.",
+            )
+            self._showErrorMessage(error_string)
+            return True
 
         else:
-            Logger.log(
-                "d",
-                "OctoPrintOutputDevice got an unhandled operation %s",
-                reply.operation(),
-            )
+            pass  # See generic error handler below
 
-        if http_status_code >= 400:
-            if http_status_code == 401 or http_status_code == 403:
-                error_string = i18n_catalog.i18nc(
-                    "@info:error",
-                    "You are not allowed to access OctoPrint with the configured API key.",
-                )
+        return False
+
+    ##  Handler for the result of a passive /login
+    #   \return True if the reply has been handled, False to continue with the generic error handling
+    def _onLoginPosted(
+        self, reply: QNetworkReply, http_status_code: int, end_point: str
+    ) -> bool:
+        if http_status_code == 200:
+            json_data = jsonFromReply(reply)
+
+            if "name" in json_data:
+                self._octoprint_user_name = json_data["name"]
             else:
-                # Received another error reply
-                if content_type == "text/plain":
-                    error_string = bytes(reply.readAll()).decode("utf-8")
-                    if not error_string:
-                        error_string = reply.attribute(
-                            QNetworkRequestAttributes.HttpReasonPhraseAttribute
-                        )
-                    error_string = error_string[:100]
-                else:
-                    error_string = i18n_catalog.i18nc(
-                        "@info:error",
-                        "OctoPrint responded with an unknown error",
-                    )
+                self._octoprint_user_name = i18n_catalog.i18nc(
+                    "@label", "Anonymous user"
+                )
+            self.additionalDataChanged.emit()
 
+        elif http_status_code == 404:
+            Logger.log("w", "Instance does not support user authorization")
+            self._octoprint_user_name = i18n_catalog.i18nc(
+                "@label", "Anonymous user"
+            )
+            self.additionalDataChanged.emit()
+            return True
+
+        elif http_status_code == 401 or http_status_code == 403:
+            self._octoprint_user_name = i18n_catalog.i18nc(
+                "@label", "Unknown user"
+            )
+            self.additionalDataChanged.emit()
+
+            error_string = i18n_catalog.i18nc(
+                "@info:error",
+                "You are not allowed to access to OctoPrint with the configured API key.",
+            )
             self._showErrorMessage(error_string)
-            Logger.log(
-                "e",
-                "OctoPrintOutputDevice got an error while accessing %s",
-                reply.url().toString(),
+            return True
+
+        return False
+
+    ##  Handler for the result of a /connection command (eg connect)
+    #   \return True if the reply has been handled, False to continue with the generic error handling
+    def _onConnectionCommandPosted(
+        self, reply: QNetworkReply, http_status_code: int, end_point: str
+    ) -> bool:
+        if http_status_code == 204:
+            Logger.log("d", "OctoPrint connection command accepted")
+
+        elif http_status_code == 401 or http_status_code == 403:
+            error_string = i18n_catalog.i18nc(
+                "@info:error",
+                "You are not allowed to control printer connections on OctoPrint with the configured API key.",
             )
-            Logger.log("e", error_string)
+            self._showErrorMessage(error_string)
+            return True
+
+        else:
+            pass  # See generic error handler below
+
+        return False
 
     def _onUploadProgress(self, bytes_sent: int, bytes_total: int) -> None:
         if not self._progress_message:
@@ -1543,22 +1656,28 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
             # timeout responses if this happens.
             self._last_response_time = time()
 
-            progress = bytes_sent / bytes_total * 100
-            previous_progress = self._progress_message.getProgress()
+            # Qt reports progress on every socket write; only whole percents that move forward are shown
+            progress = bytes_sent * 100 // bytes_total
+            if progress <= self._upload_progress:
+                return
+            self._upload_progress = progress
+
             if progress < 100:
-                if previous_progress is not None and progress > previous_progress:
-                    self._progress_message.setProgress(progress)
+                self._progress_message.setProgress(progress)
             else:
                 self._progress_message.hide()
-                self._progress_message = Message(
-                    i18n_catalog.i18nc("@info:status", "Storing data on OctoPrint"),
-                    0,
-                    False,
-                    -1,
-                    title=i18n_catalog.i18nc("@label", "OctoPrint"),
-                )
+                if self._storing_message is None:
+                    self._storing_message = Message(
+                        i18n_catalog.i18nc("@info:status", "Storing data on OctoPrint"),
+                        0,
+                        False,
+                        -1,
+                        title=i18n_catalog.i18nc("@label", "OctoPrint"),
+                    )
+                self._progress_message = self._storing_message
                 self._progress_message.show()
-        else:
+        elif self._progress_message is not self._storing_message:
+            # the indeterminate storing message is reused for later uploads, so it is left alone
             self._progress_message.setProgress(0)
 
     def _onUploadFinished(self, reply: QNetworkReply) -> None:
@@ -1591,12 +1710,7 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
 
         elif http_status_code >= 400:
             if content_type == "text/plain":
-                error_string = bytes(reply.readAll()).decode("utf-8")
-                if not error_string:
-                    error_string = reply.attribute(
-                        QNetworkRequestAttributes.HttpReasonPhraseAttribute
-                    )
-                error_string = error_string[:100]
+                error_string = self._errorStringFromReply(reply)
             else:
                 error_string = i18n_catalog.i18nc(
                     "@info:error",
@@ -1615,11 +1729,10 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
             return
 
         location_url = reply.header(QNetworkRequestKnownHeaders.LocationHeader)
-        Logger.log(
-            "d", "Resource created on OctoPrint instance: %s", location_url.toString()
-        )
+        location_string = location_url.toString()
+        Logger.log("d", "Resource created on OctoPrint instance: %s", location_string)
 
-        end_point = location_url.toString().split(self._api_prefix, 1)[1]
+        end_point = location_string.split(self._api_prefix, 1)[1]
         if self._transfer_as_ufp and end_point.endswith(".ufp"):
             if self._ufp_plugin_version < Version(
                 "0.1.7"
@@ -1705,21 +1818,21 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
             )  # start polling the API for information about this file
 
     def parseSettingsData(self, json_data: Dict[str, Any]) -> None:
-        self._store_on_sd_supported = False
-        if "feature" in json_data and "sdSupport" in json_data["feature"]:
-            self._store_on_sd_supported = json_data["feature"]["sdSupport"]
+        self._store_on_sd_supported = json_data.get("feature", {}).get(
+            "sdSupport", False
+        )
 
         webcam_data = []
-        if "webcam" in json_data and "streamUrl" in json_data["webcam"]:
-            webcam_data = [json_data["webcam"]]
+        webcam = json_data.get("webcam", {})
+        if "streamUrl" in webcam:
+            webcam_data = [webcam]
 
-        if "gcodeAnalysis" in json_data and "runAt" in json_data["gcodeAnalysis"]:
-            self._gcode_analysis_requires_wait = (
-                json_data["gcodeAnalysis"]["runAt"] == "idle"
-            )
+        gcode_analysis_run_at = json_data.get("gcodeAnalysis", {}).get("runAt", None)
+        if gcode_analysis_run_at is not None:
+            self._gcode_analysis_requires_wait = gcode_analysis_run_at == "idle"
 
-        if "plugins" in json_data:
-            plugin_data = json_data["plugins"]
+        plugin_data = json_data.get("plugins", None)
+        if plugin_data is not None:
             self._power_plugins_manager.parsePluginData(plugin_data)
 
             if (
@@ -1810,18 +1923,30 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
     def _openOctoPrint(self, message: Message, action_id: str) -> None:
         QDesktopServices.openUrl(QUrl(self._base_url))
 
+    ##  Get the start of the plain text body of an error reply, or the reason phrase if the body is empty
+    def _errorStringFromReply(self, reply: QNetworkReply, length: int = 100) -> str:
+        # Only the part of the body that is shown is read; a character takes at most 4 bytes in utf-8
+        error_string = bytes(reply.read(length * 4) or b"").decode(
+            "utf-8", errors="replace"
+        )
+        if not error_string:
+            error_string = (
+                reply.attribute(QNetworkRequestAttributes.HttpReasonPhraseAttribute)
+                or ""
+            )
+        return error_string[:length]
+
     def _createEmptyRequest(
         self, target: str, content_type: Optional[str] = "application/json"
     ) -> QNetworkRequest:
-        request = QNetworkRequest(QUrl(self._api_url + target))
-        try:
-            request.setAttribute(QNetworkRequestAttributes.FollowRedirectsAttribute, True)
-        except AttributeError:
-            # in Qt6, this is no longer possible (or required), see https://doc.qt.io/qt-6/network-changes-qt6.html#redirect-policies
-            pass
+        url = self._polling_urls.get(target, None)
+        if url is None:
+            url = QUrl(self._api_url + target)
+        request = QNetworkRequest(url)
+        setFollowRedirects(request)
 
         request.setRawHeader(b"X-Api-Key", self._api_key)
-        request.setRawHeader(b"User-Agent", self._user_agent.encode())
+        request.setRawHeader(b"User-Agent", self._user_agent_header)
 
         if content_type is not None:
             request.setHeader(QNetworkRequestKnownHeaders.ContentTypeHeader, content_type)
@@ -1855,20 +1980,24 @@ class OctoPrintOutputDevice(NetworkedPrinterOutputDevice):
     #  self-signed certificates
     def get(
         self, url: str, on_finished: Optional[Callable[[QNetworkReply], None]]
-    ) -> None:
+    ) -> Optional[QNetworkReply]:
         self._validateManager()
 
         request = self._createEmptyRequest(url)
+        if url in self._polling_urls:
+            # the polled end points can share a single connection
+            setHttp2Allowed(request)
         self._last_request_time = time()
 
         if not self._manager:
             Logger.log(
                 "e", "No network manager was created to execute the GET call with."
             )
-            return
+            return None
 
         reply = self._manager.get(request)
         self._registerOnFinishedCallback(reply, on_finished)
+        return reply
 
     ## Overloaded from NetworkedPrinterOutputDevice.post() to backport https://github.com/Ultimaker/Cura/pull/4678
     #  and allow self-signed certificates
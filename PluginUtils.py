@@ -0,0 +1,68 @@
+# Copyright (c) 2022 Aldo Hoeben / fieldOfView
+# OctoPrintPlugin is released under the terms of the AGPLv3 or higher.
+
+from UM.Logger import Logger
+
+try:
+    from cura.ApplicationMetadata import CuraSDKVersion
+except ImportError: # Cura <= 3.6
+    CuraSDKVersion = "6.0.0"
+if CuraSDKVersion >= "8.0.0":
+    from PyQt6.QtNetwork import QNetworkRequest, QNetworkReply
+
+    QNetworkRequestAttributes = QNetworkRequest.Attribute
+else:
+    from PyQt5.QtNetwork import QNetworkRequest, QNetworkReply
+
+    QNetworkRequestAttributes = QNetworkRequest
+
+import os.path
+import json
+import functools
+
+from typing import Any, Dict
+
+# Request attributes that are not available in all supported Qt versions:
+# in Qt6, following redirects is no longer possible (or required), see https://doc.qt.io/qt-6/network-changes-qt6.html#redirect-policies
+_follow_redirects_attribute = getattr(QNetworkRequestAttributes, "FollowRedirectsAttribute", None)
+# HTTP/2 is not available before Qt 5.15
+_http2_allowed_attribute = getattr(QNetworkRequestAttributes, "Http2AllowedAttribute", None)
+
+
+##  Get version information from plugin.json; the file is only read once per session
+@functools.lru_cache(maxsize=None)
+def getPluginVersion() -> str:
+    plugin_file_path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "plugin.json"
+    )
+    try:
+        with open(plugin_file_path) as plugin_file:
+            plugin_info = json.load(plugin_file)
+            return plugin_info["version"]
+    except:
+        # The actual version info is not critical to have so we can continue
+        Logger.logException("w", "Could not get version information for the plugin")
+        return "0.0"
+
+
+##  Decode the JSON body of a reply, or get an empty dict if the reply does not contain valid JSON
+def jsonFromReply(reply: QNetworkReply) -> Dict[str, Any]:
+    # json.loads only accepts bytes from Python 3.6, and Cura 3.5 and 3.6 still bundle Python 3.5
+    try:
+        return json.loads(bytes(reply.readAll()).decode("utf-8"))
+    except (ValueError, UnicodeDecodeError):
+        Logger.log("w", "Received invalid JSON from octoprint instance.")
+        return {}
+
+
+##  Let a request follow redirects, if the Qt version does not do so by itself
+def setFollowRedirects(request: QNetworkRequest) -> None:
+    if _follow_redirects_attribute is not None:
+        request.setAttribute(_follow_redirects_attribute, True)
+
+
+##  Let a request use HTTP/2 if (a reverse proxy in front of) OctoPrint supports it, so repeated requests can share
+#   a single multiplexed connection
+def setHttp2Allowed(request: QNetworkRequest) -> None:
+    if _http2_allowed_attribute is not None:
+        request.setAttribute(_http2_allowed_attribute, True)
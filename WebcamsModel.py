@@ -13,7 +13,20 @@ else:
 from UM.Qt.ListModel import ListModel
 from UM.Logger import Logger
 
-from typing import List, Dict, Any, Union
+import re
+
+from typing import List, Dict, Any, Tuple, Union
+
+# Matches absolute stream urls (http:// and https://, in any case) without creating a lowercase copy of the url
+_absolute_url_regex = re.compile(r"http", re.IGNORECASE)
+
+# Additional rotation and mirroring of a webcam image by its (flipH, flipV) settings
+_flip_orientations = {
+    (False, False): (0, False),
+    (True, False): (180, True),
+    (False, True): (0, True),
+    (True, True): (180, False),
+}  # type: Dict[Tuple[bool, bool], Tuple[int, bool]]
 
 
 class WebcamsModel(ListModel):
@@ -32,6 +45,19 @@ class WebcamsModel(ListModel):
         self._port = port
         self._basic_auth_string = basic_auth_string
 
+        # prefixes for relative stream urls; these do not change for the lifetime of the model
+        self._scheme_prefix = "%s:" % protocol
+        self._host_prefix = "%s://%s" % (protocol, address)
+        if not basic_auth_string:
+            self._origin_prefix = "%s://%s:%d" % (protocol, address, port)
+        else:
+            self._origin_prefix = "%s://%s@%s:%d" % (
+                protocol,
+                basic_auth_string,
+                address,
+                port,
+            )
+
         try:
             user_role = Qt.ItemDataRole.UserRole
         except AttributeError:
@@ -61,48 +87,23 @@ class WebcamsModel(ListModel):
 
             if not stream_url:  # empty string or None
                 continue
-            elif stream_url[:4].lower() == "http":  # absolute uri
+            elif _absolute_url_regex.match(stream_url):  # absolute uri
                 item["stream_url"] = stream_url
-            elif stream_url[:2] == "//":  # protocol-relative
-                item["stream_url"] = "%s:%s" % (self._protocol, stream_url)
-            elif stream_url[:1] == ":":  # domain-relative (on another port)
-                item["stream_url"] = "%s://%s%s" % (
-                    self._protocol,
-                    self._address,
-                    stream_url,
-                )
-            elif stream_url[:1] == "/":  # domain-relative (on same port)
-                if not self._basic_auth_string:
-                    item["stream_url"] = "%s://%s:%d%s" % (
-                        self._protocol,
-                        self._address,
-                        self._port,
-                        stream_url,
-                    )
-                else:
-                    item["stream_url"] = "%s://%s@%s:%d%s" % (
-                        self._protocol,
-                        self._basic_auth_string,
-                        self._address,
-                        self._port,
-                        stream_url,
-                    )
+            elif stream_url.startswith("//"):  # protocol-relative
+                item["stream_url"] = self._scheme_prefix + stream_url
+            elif stream_url[0] == ":":  # domain-relative (on another port)
+                item["stream_url"] = self._host_prefix + stream_url
+            elif stream_url[0] == "/":  # domain-relative (on same port)
+                item["stream_url"] = self._origin_prefix + stream_url
             else:
                 Logger.log("w", "Unusable stream url received: %s", stream_url)
                 item["stream_url"] = ""
 
             if "rotate90" in webcam:
-                item["rotation"] = -90 if webcam["rotate90"] else 0
-                if webcam["flipH"] and webcam["flipV"]:
-                    item["mirror"] = False
-                    item["rotation"] += 180  # type: ignore
-                elif webcam["flipH"]:
-                    item["mirror"] = True
-                    item["rotation"] += 180  # type: ignore
-                elif webcam["flipV"]:
-                    item["mirror"] = True
-                else:
-                    item["mirror"] = False
+                flip_rotation, item["mirror"] = _flip_orientations[
+                    (bool(webcam["flipH"]), bool(webcam["flipV"]))
+                ]
+                item["rotation"] = (-90 if webcam["rotate90"] else 0) + flip_rotation
 
             if "name" in webcam and webcam["name"] != None:
                 item["name"] = webcam["name"]